@@ -6,15 +6,24 @@
 # supporting whiteboard sharing, file synchronization, and team collaboration.
 
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import re
-from typing import Any
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 import deepmerge
 import openai_client
 import tiktoken
 from content_safety.evaluators import CombinedContentSafetyEvaluator
 from openai.types.chat import ChatCompletionMessageParam
+from openai_client.tools import complete_with_tool_calls
+from pydantic import ValidationError
 from semantic_workbench_api_model import workbench_model
 from semantic_workbench_api_model.workbench_model import (
     AssistantStateEvent,
@@ -35,14 +44,27 @@ from semantic_workbench_assistant.assistant_app import (
     ConversationContext,
 )
 
+from .command_processor import process_command
 from .config import AssistantConfigModel, ContextTransferConfigModel
+from .project_data import LogEntryType, RequestStatus
 from .project_files import ProjectFileManager
-from .project_manager import ProjectManager
-from .project_storage import ConversationProjectManager, ProjectNotifier, ProjectRole, ProjectStorage
+from .project_manager import ProjectManager, close_whiteboard_clients
+from .project_storage import (
+    ConversationProjectManager,
+    CoordinatorConversationMessage,
+    CoordinatorMessageBatcher,
+    ProjectLogWriter,
+    ProjectRole,
+    ProjectStorage,
+)
 from .state_inspector import ProjectInspectorStateProvider
+from .utils import load_text_include
 
 logger = logging.getLogger(__name__)
 
+# Matches the "[participant name]: " prefix the model sometimes echoes back.
+_USERNAME_PREFIX_PATTERN = re.compile(r"\[.*?\]:\s")
+
 service_id = "project-assistant.made-exploration"
 service_name = "Project Assistant"
 service_description = "A mediator assistant that facilitates file sharing between conversations."
@@ -89,6 +111,173 @@ assistant = AssistantApp(
 app = assistant.fastapi_app()
 
 
+@assistant.events.on_service_shutdown
+async def on_service_shutdown() -> None:
+    # Write out the Coordinator messages and log entries still queued in the background
+    CoordinatorMessageBatcher.flush_all()
+    await ProjectLogWriter.flush()
+    await close_whiteboard_clients()
+
+
+# Maximum number of conversations (or projects) kept in each of the caches below. The least
+# recently used entries are evicted first, so entries for conversations that have gone away
+# don't accumulate.
+CONVERSATION_CACHE_SIZE = 1_000
+
+CacheValueT = TypeVar("CacheValueT")
+
+
+def get_cache_entry(cache: OrderedDict[str, CacheValueT], key: str) -> CacheValueT | None:
+    """
+    Gets an entry from a least recently used cache, marking it as recently used.
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def set_cache_entry(cache: OrderedDict[str, CacheValueT], key: str, value: CacheValueT) -> None:
+    """
+    Sets an entry in a least recently used cache, evicting the oldest entry if the cache is full.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > CONVERSATION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+# Per-conversation cache of the project association and role, keyed by conversation ID.
+# Only positive lookups are cached, so a conversation that has not been set up yet will
+# keep checking storage until /start or /join associates it with a project. The lookups are
+# idempotent, so concurrent misses for a conversation just read storage more than once.
+_project_id_cache: OrderedDict[str, str] = OrderedDict()
+_role_cache: OrderedDict[str, ProjectRole] = OrderedDict()
+# Result of detect_assistant_role, cached once it is backed by a project association
+_role_detect_cache: OrderedDict[str, str] = OrderedDict()
+# Conversation ID that created each project's brief, keyed by project ID
+_brief_owner_cache: OrderedDict[str, str] = OrderedDict()
+
+
+async def get_cached_project_id(context: ConversationContext) -> str | None:
+    """
+    Gets the project ID for the conversation, reading from storage only on a cache miss.
+    """
+    project_id = get_cache_entry(_project_id_cache, context.id)
+    if project_id:
+        return project_id
+
+    project_id = await ProjectManager.get_project_id(context)
+    if project_id:
+        set_cache_entry(_project_id_cache, context.id, project_id)
+    return project_id
+
+
+async def get_cached_role(context: ConversationContext) -> ProjectRole | None:
+    """
+    Gets the project role for the conversation, reading from storage only on a cache miss.
+    """
+    role = get_cache_entry(_role_cache, context.id)
+    if role:
+        return role
+
+    role = await ConversationProjectManager.get_conversation_role(context)
+    if role:
+        set_cache_entry(_role_cache, context.id, role)
+    return role
+
+
+def get_brief_owner(project_id: str) -> str | None:
+    """
+    Gets the ID of the conversation that created the project brief, reading the brief only on a cache miss.
+    """
+    owner = get_cache_entry(_brief_owner_cache, project_id)
+    if owner:
+        return owner
+
+    briefing = ProjectStorage.read_project_brief(project_id)
+    if briefing and briefing.conversation_id:
+        set_cache_entry(_brief_owner_cache, project_id, briefing.conversation_id)
+        return briefing.conversation_id
+    return None
+
+
+def invalidate_project_cache(context: ConversationContext) -> None:
+    """
+    Drops the cached project ID and role for the conversation so the next lookup reads storage.
+    """
+    _project_id_cache.pop(context.id, None)
+    _role_cache.pop(context.id, None)
+    _role_detect_cache.pop(context.id, None)
+
+
+# Participant names per conversation, keyed by conversation ID, as (fetched_at, {participant_id: name})
+PARTICIPANTS_CACHE_TTL_SECONDS = 30.0
+_participants_cache: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+
+
+async def get_participant_name(context: ConversationContext, participant_id: str, default: str = "Coordinator") -> str:
+    """
+    Gets a participant's name, refreshing the conversation's participant list at most once per TTL.
+    """
+    cached = get_cache_entry(_participants_cache, context.id)
+    if not cached or time.monotonic() - cached[0] >= PARTICIPANTS_CACHE_TTL_SECONDS:
+        participants = await context.get_participants()
+        cached = (time.monotonic(), {p.id: p.name for p in participants.participants})
+        set_cache_entry(_participants_cache, context.id, cached)
+
+    return cached[1].get(participant_id, default)
+
+
+async def send_state_events_batch(context: ConversationContext, state_ids: list[str]) -> None:
+    """
+    Sends an "updated" state event for each of the given state IDs concurrently.
+    """
+    async with asyncio.TaskGroup() as tg:
+        for state_id in state_ids:
+            tg.create_task(
+                context.send_conversation_state_event(
+                    AssistantStateEvent(state_id=state_id, event="updated", state=None)
+                )
+            )
+
+
+# Maximum number of concurrent file copies to Team conversations
+MAX_CONCURRENT_FILE_COPIES = 8
+
+
+async def copy_file_to_team_conversations(
+    context: ConversationContext, project_id: str, filename: str, team_conversations: list[str]
+) -> list[bool]:
+    """
+    Copies a project file to each of the given Team conversations concurrently.
+
+    Returns:
+        A success flag for each Team conversation, in the same order as team_conversations
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_COPIES)
+
+    async def copy_to(team_conv_id: str) -> bool:
+        async with semaphore:
+            logger.info("Copying file to Team conversation %s: %s", team_conv_id, filename)
+            return await ProjectFileManager.copy_file_to_conversation(
+                context=context, project_id=project_id, filename=filename, target_conversation_id=team_conv_id
+            )
+
+    results = await asyncio.gather(
+        *[copy_to(team_conv_id) for team_conv_id in team_conversations], return_exceptions=True
+    )
+
+    copied: list[bool] = []
+    for team_conv_id, result in zip(team_conversations, results):
+        if isinstance(result, BaseException):
+            logger.error("Error copying file to Team conversation %s: %s", team_conv_id, result)
+            copied.append(False)
+        else:
+            copied.append(result)
+    return copied
+
+
 @assistant.events.conversation.message.chat.on_created
 async def on_message_created(
     context: ConversationContext, event: ConversationEvent, message: ConversationMessage
@@ -111,55 +300,35 @@ async def on_message_created(
         setup_complete = metadata.get("setup_complete", False)
 
         # First check if project ID exists - if it does, setup should always be considered complete
-        from .project_manager import ProjectManager
-
-        project_id = await ProjectManager.get_project_id(context)
+        project_id = await get_cached_project_id(context)
         if project_id:
             # If we have a project ID, we should never show the setup instructions
             setup_complete = True
 
             # If metadata doesn't reflect this, try to get actual role
-            from .project_storage import ConversationProjectManager
-
-            role = await ConversationProjectManager.get_conversation_role(context)
+            role = await get_cached_role(context)
             if role:
-                metadata["project_role"] = role.value
-                metadata["assistant_mode"] = role.value
-                metadata["setup_complete"] = True
-                logger.info(f"Found project role in storage: {role.value}")
+                metadata.update(project_role=role.value, assistant_mode=role.value, setup_complete=True)
+                logger.info("Found project role in storage: %s", role.value)
 
                 # Update conversation metadata to fix this inconsistency
-                await context.send_conversation_state_event(
-                    AssistantStateEvent(state_id="setup_complete", event="updated", state=None)
-                )
-                await context.send_conversation_state_event(
-                    AssistantStateEvent(state_id="project_role", event="updated", state=None)
-                )
-                await context.send_conversation_state_event(
-                    AssistantStateEvent(state_id="assistant_mode", event="updated", state=None)
-                )
+                await send_state_events_batch(context, ["setup_complete", "project_role", "assistant_mode"])
             else:
                 # Default to team if we can't determine
-                metadata["project_role"] = "team"
-                metadata["assistant_mode"] = "team"
-                metadata["setup_complete"] = True
+                metadata.update(project_role="team", assistant_mode="team", setup_complete=True)
                 logger.info("Could not determine role from storage, defaulting to team mode")
         # If no project ID, check storage as a fallback
         elif not setup_complete:
             try:
-                from .project_storage import ConversationProjectManager
-
                 # Check if we have a project role in storage
-                role = await ConversationProjectManager.get_conversation_role(context)
+                role = await get_cached_role(context)
                 if role:
                     # If we have a role in storage, consider setup complete
                     setup_complete = True
-                    metadata["setup_complete"] = True
-                    metadata["project_role"] = role.value
-                    metadata["assistant_mode"] = role.value
-                    logger.info(f"Found project role in storage: {role.value}")
-            except Exception as e:
-                logger.exception(f"Error getting role from project storage: {e}")
+                    metadata.update(setup_complete=True, project_role=role.value, assistant_mode=role.value)
+                    logger.info("Found project role in storage: %s", role.value)
+            except Exception:
+                logger.exception("Error getting role from project storage")
 
         assistant_mode = metadata.get("assistant_mode", "setup")
 
@@ -196,24 +365,16 @@ async def on_message_created(
         if role == "coordinator" and message.message_type == MessageType.chat:
             try:
                 # Get the project ID
-                from .project_manager import ProjectManager
-
-                project_id = await ProjectManager.get_project_id(context)
+                project_id = await get_cached_project_id(context)
 
                 if project_id:
                     # Get the sender's name
                     sender_name = "Coordinator"
                     if message.sender:
-                        participants = await context.get_participants()
-                        for participant in participants.participants:
-                            if participant.id == message.sender.participant_id:
-                                sender_name = participant.name
-                                break
+                        sender_name = await get_participant_name(context, message.sender.participant_id)
 
-                    # Store the message for Team access
-                    from .project_storage import ProjectStorage
-
-                    ProjectStorage.append_coordinator_message(
+                    # Queue the message for Team access; queued messages are written in batches
+                    CoordinatorMessageBatcher.enqueue(
                         project_id=project_id,
                         message_id=str(message.id),
                         content=message.content,
@@ -221,14 +382,12 @@ async def on_message_created(
                         is_assistant=message.sender.participant_role == ParticipantRole.assistant,
                         timestamp=message.timestamp,
                     )
-                    logger.info(f"Stored Coordinator message for Team access: {message.id}")
-            except Exception as e:
+                    logger.info("Queued Coordinator message for Team access: %s", message.id)
+            except Exception:
                 # Don't fail message handling if storage fails
-                logger.exception(f"Error storing Coordinator message for Team access: {e}")
+                logger.exception("Error storing Coordinator message for Team access")
 
         # Prepare custom system message based on role
-        from .utils import load_text_include
-
         role_specific_prompt = ""
 
         if role == "coordinator":
@@ -283,10 +442,11 @@ async def on_command_created(
             )
 
         # Process the command using the command processor
-        from .command_processor import process_command
-
         command_processed = await process_command(context, message)
 
+        # Commands such as /start and /join can change the project association and role
+        invalidate_project_cache(context)
+
         # If the command wasn't recognized or processed, respond normally
         if not command_processed:
             await respond_to_conversation(
@@ -299,6 +459,44 @@ async def on_command_created(
         await context.update_participant_me(UpdateParticipant(status=None))
 
 
+# Latest in-flight file event task for each file, keyed by (project ID, filename). Each task holds
+# a reference to the one before it, so none are garbage collected while the chain is running.
+_file_event_tasks: dict[tuple[str, str], asyncio.Task] = {}
+
+
+def start_file_event_task(project_id: str, filename: str, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """
+    Runs file event processing in the background so the event handler can return immediately.
+
+    Events for the same file are processed one after another in the order they arrived, so a
+    deletion can't be overtaken by a copy from an earlier creation or update that is still running.
+    """
+    key = (project_id, filename)
+    task = asyncio.create_task(_run_after(_file_event_tasks.get(key), coro))
+    _file_event_tasks[key] = task
+    task.add_done_callback(functools.partial(_discard_file_event_task, key))
+    return task
+
+
+async def _run_after(previous: asyncio.Task | None, coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Runs the coroutine once the previous task, if any, has finished (whether or not it succeeded).
+    """
+    try:
+        if previous:
+            await asyncio.wait([previous])
+    except asyncio.CancelledError:
+        coro.close()
+        raise
+
+    await coro
+
+
+def _discard_file_event_task(key: tuple[str, str], task: asyncio.Task) -> None:
+    if _file_event_tasks.get(key) is task:
+        del _file_event_tasks[key]
+
+
 @assistant.events.conversation.file.on_created
 async def on_file_created(
     context: ConversationContext,
@@ -317,40 +515,61 @@ async def on_file_created(
     """
     try:
         # Log file creation event details
-        logger.info(f"File created event: filename={file.filename}, size={file.file_size}, type={file.content_type}")
-        logger.info(f"Full file object: {file}")
+        logger.info(
+            "File created event: filename=%s, size=%s, type=%s", file.filename, file.file_size, file.content_type
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full file object: %s", file)
+
+        # A file without a name can't be tracked, so skip the storage lookups entirely
+        if not file.filename:
+            logger.warning("Missing filename in file created event")
+            return
 
         # Get project ID
-        project_id = await ProjectManager.get_project_id(context)
-        if not project_id or not file.filename:
-            logger.warning(
-                f"No project ID found or missing filename: project_id={project_id}, filename={file.filename}"
-            )
+        project_id = await get_cached_project_id(context)
+        if not project_id:
+            logger.warning("No project ID found for file: %s", file.filename)
             return
 
         # Get the conversation's role
-        role = await ConversationProjectManager.get_conversation_role(context)
+        role = await get_cached_role(context)
 
         # If role couldn't be determined, skip processing
         if not role:
-            logger.warning(f"Could not determine conversation role for file handling: {file.filename}")
+            logger.warning("Could not determine conversation role for file handling: %s", file.filename)
             return
 
-        logger.info(f"Processing file {file.filename} with role: {role.value}, project: {project_id}")
+        # Copying and fan-out can take a while, so do it in the background
+        start_file_event_task(project_id, file.filename, _process_file_created(context, project_id, file, role))
+
+    except Exception:
+        logger.exception("Error handling file creation")
+
+
+async def _process_file_created(
+    context: ConversationContext, project_id: str, file: workbench_model.File, role: ProjectRole
+) -> None:
+    """
+    Processes a file creation event in the background.
+    """
+    try:
+        filename = file.filename
+        is_coordinator = role == ProjectRole.COORDINATOR
+
+        logger.info("Processing file %s with role: %s, project: %s", filename, role.value, project_id)
 
         # Use ProjectFileManager for file operations
 
+        # Team conversations are only notified about Coordinator files
+        update_type = ""
+        notification = None
+
         # Process based on role
-        if role.value == "coordinator":
+        if is_coordinator:
             # For Coordinator files:
             # 1. Store in project storage (marked as coordinator file)
-            logger.info(f"Copying Coordinator file to project storage: {file.filename}")
-
-            # Check project files directory
-            from .project_files import ProjectFileManager
-
-            files_dir = ProjectFileManager.get_project_files_dir(project_id)
-            logger.info(f"Project files directory: {files_dir} (exists: {files_dir.exists()})")
+            logger.info("Copying Coordinator file to project storage: %s", filename)
 
             # Copy file to project storage
             success = await ProjectFileManager.copy_file_to_project_storage(
@@ -358,71 +577,78 @@ async def on_file_created(
             )
 
             if not success:
-                logger.error(f"Failed to copy file to project storage: {file.filename}")
+                logger.error("Failed to copy file to project storage: %s", filename)
                 return
 
-            # Verify file was stored correctly
-            file_path = ProjectFileManager.get_file_path(project_id, file.filename)
-            if file_path.exists():
-                logger.info(f"File successfully stored at: {file_path} (size: {file_path.stat().st_size} bytes)")
-            else:
-                logger.error(f"File not found at expected location: {file_path}")
+            # The copy reports its own success; only verify the stored file and metadata when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                file_path = ProjectFileManager.get_file_path(project_id, filename)
+                if file_path.exists():
+                    logger.debug(
+                        "File successfully stored at: %s (size: %s bytes)", file_path, file_path.stat().st_size
+                    )
+                else:
+                    logger.debug("File not found at expected location: %s", file_path)
 
-            # Check file metadata was updated
-            metadata = ProjectFileManager.read_file_metadata(project_id)
-            if metadata and any(f.filename == file.filename for f in metadata.files):
-                logger.info(f"File metadata updated successfully for {file.filename}")
-            else:
-                logger.error(f"File metadata not updated for {file.filename}")
+                metadata = ProjectFileManager.read_file_metadata(project_id)
+                if metadata and any(f.filename == filename for f in metadata.files):
+                    logger.debug("File metadata updated successfully for %s", filename)
+                else:
+                    logger.debug("File metadata not updated for %s", filename)
 
             # 2. Synchronize to all Team conversations
             # Get all Team conversations
             team_conversations = await ProjectFileManager.get_team_conversations(context, project_id)
 
             if team_conversations:
-                logger.info(f"Found {len(team_conversations)} team conversations to update")
+                logger.info("Found %s team conversations to update", len(team_conversations))
 
-                # Copy to each Team conversation
-                for team_conv_id in team_conversations:
-                    logger.info(f"Copying file to Team conversation {team_conv_id}: {file.filename}")
-                    copy_success = await ProjectFileManager.copy_file_to_conversation(
-                        context=context,
-                        project_id=project_id,
-                        filename=file.filename,
-                        target_conversation_id=team_conv_id,
+                # Copy to all Team conversations concurrently
+                results = await copy_file_to_team_conversations(context, project_id, filename, team_conversations)
+                for team_conv_id, copy_success in zip(team_conversations, results):
+                    logger.info(
+                        "Copy to Team conversation %s: %s", team_conv_id, "Success" if copy_success else "Failed"
                     )
-                    logger.info(f"Copy to Team conversation {team_conv_id}: {'Success' if copy_success else 'Failed'}")
             else:
                 logger.info("No team conversations found to update files")
 
             # 3. Notify Team conversations about the new file
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
-                update_type="file_created",
-                message=f"Coordinator shared a file: {file.filename}",
-                data={"filename": file.filename},
-            )
+            update_type = "file_created"
+            notification = f"Coordinator shared a file: {filename}"
         else:
             # For Team files, no special handling needed
             # They're already available in the conversation
-            logger.info(f"Team file created (not shared to project storage): {file.filename}")
+            logger.info("Team file created (not shared to project storage): %s", filename)
 
-        # Log file creation to project log for all files
-        await ProjectStorage.log_project_event(
+        # Log file creation to project log for all files, notifying Team conversations if needed
+        await ProjectStorage.log_and_notify(
             context=context,
             project_id=project_id,
             entry_type="file_shared",
-            message=f"File shared: {file.filename}",
+            message=f"File shared: {filename}",
             metadata={
                 "file_id": getattr(file, "id", ""),
-                "filename": file.filename,
-                "is_coordinator_file": role.value == "coordinator",
+                "filename": filename,
+                "is_coordinator_file": is_coordinator,
             },
+            update_type=update_type,
+            notification=notification,
+            data={"filename": filename},
         )
 
-    except Exception as e:
-        logger.exception(f"Error handling file creation: {e}")
+    except (OSError, ValidationError) as e:
+        # Unreadable or malformed project storage is recoverable, so skip the traceback
+        logger.warning("Project storage error handling file creation: %s", e)
+    except Exception:
+        logger.exception("Error handling file creation")
+
+
+# File update events for the same file arriving within this window are coalesced
+FILE_UPDATE_DEBOUNCE_SECONDS = 0.25
+
+# Pending file updates, keyed by (project ID, conversation ID, filename)
+_pending_file_updates: dict[tuple[str, str, str], asyncio.TimerHandle] = {}
+_pending_file_args: dict[tuple[str, str, str], tuple[ConversationContext, workbench_model.File]] = {}
 
 
 @assistant.events.conversation.file.on_updated
@@ -440,75 +666,119 @@ async def on_file_updated(
 
     For Team files:
     1. Use as-is without updating in project storage
+
+    The workbench often emits several update events for a single edit, so updates to the
+    same file are coalesced and only the latest one within FILE_UPDATE_DEBOUNCE_SECONDS
+    is processed.
     """
     try:
+        if not file.filename:
+            return
+
         # Get project ID
-        project_id = await ProjectManager.get_project_id(context)
-        if not project_id or not file.filename:
+        project_id = await get_cached_project_id(context)
+        if not project_id:
             return
 
+        # Replace any pending update for this file with the latest one
+        key = (project_id, str(context.id), file.filename)
+        _pending_file_args[key] = (context, file)
+        pending = _pending_file_updates.pop(key, None)
+        if pending:
+            pending.cancel()
+
+        _pending_file_updates[key] = asyncio.get_running_loop().call_later(
+            FILE_UPDATE_DEBOUNCE_SECONDS, _flush_file_update, key
+        )
+
+    except Exception:
+        logger.exception("Error handling file update")
+
+
+def _flush_file_update(key: tuple[str, str, str]) -> None:
+    """
+    Starts processing the latest pending update for a file once its debounce window has elapsed.
+    """
+    _pending_file_updates.pop(key, None)
+    args = _pending_file_args.pop(key, None)
+    if not args:
+        return
+
+    context, file = args
+    start_file_event_task(key[0], key[2], _process_file_updated(context, key[0], file))
+
+
+async def _process_file_updated(context: ConversationContext, project_id: str, file: workbench_model.File) -> None:
+    """
+    Processes a (debounced) file update event.
+    """
+    try:
+        filename = file.filename
+
         # Get the conversation's role
-        role = await ConversationProjectManager.get_conversation_role(context)
+        role = await get_cached_role(context)
 
         # If role couldn't be determined, skip processing
         if not role:
-            logger.warning(f"Could not determine conversation role for file update: {file.filename}")
+            logger.warning("Could not determine conversation role for file update: %s", filename)
             return
 
+        is_coordinator = role == ProjectRole.COORDINATOR
+
         # Use ProjectFileManager for file operations
 
+        # Team conversations are only notified about Coordinator files
+        update_type = ""
+        notification = None
+
         # Process based on role
-        if role.value == "coordinator":
+        if is_coordinator:
             # For Coordinator files:
             # 1. Update in project storage
-            logger.info(f"Updating Coordinator file in project storage: {file.filename}")
+            logger.info("Updating Coordinator file in project storage: %s", filename)
             success = await ProjectFileManager.copy_file_to_project_storage(
                 context=context, project_id=project_id, file=file, is_coordinator_file=True
             )
 
             if not success:
-                logger.error(f"Failed to update file in project storage: {file.filename}")
+                logger.error("Failed to update file in project storage: %s", filename)
                 return
 
             # 2. Update in all Team conversations
             # Get all Team conversations
             team_conversations = await ProjectFileManager.get_team_conversations(context, project_id)
 
-            # Update in each Team conversation
-            for team_conv_id in team_conversations:
-                logger.info(f"Updating file in Team conversation {team_conv_id}: {file.filename}")
-                await ProjectFileManager.copy_file_to_conversation(
-                    context=context, project_id=project_id, filename=file.filename, target_conversation_id=team_conv_id
-                )
+            # Update in all Team conversations concurrently
+            await copy_file_to_team_conversations(context, project_id, filename, team_conversations)
 
             # 3. Notify Team conversations about the updated file
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
-                update_type="file_updated",
-                message=f"Coordinator updated a file: {file.filename}",
-                data={"filename": file.filename},
-            )
+            update_type = "file_updated"
+            notification = f"Coordinator updated a file: {filename}"
         else:
             # For Team files, no special handling needed
             # They're already available in the conversation
-            logger.info(f"Team file updated (not shared to project storage): {file.filename}")
+            logger.info("Team file updated (not shared to project storage): %s", filename)
 
-        # Log file update to project log for all files
-        await ProjectStorage.log_project_event(
+        # Log file update to project log for all files, notifying Team conversations if needed
+        await ProjectStorage.log_and_notify(
             context=context,
             project_id=project_id,
             entry_type="file_shared",
-            message=f"File updated: {file.filename}",
+            message=f"File updated: {filename}",
             metadata={
                 "file_id": getattr(file, "id", ""),
-                "filename": file.filename,
-                "is_coordinator_file": role.value == "coordinator",
+                "filename": filename,
+                "is_coordinator_file": is_coordinator,
             },
+            update_type=update_type,
+            notification=notification,
+            data={"filename": filename},
         )
 
-    except Exception as e:
-        logger.exception(f"Error handling file update: {e}")
+    except (OSError, ValidationError) as e:
+        logger.warning("Project storage error handling file update: %s", e)
+    except Exception:
+        logger.exception("Error handling file update")
 
 
 @assistant.events.conversation.file.on_deleted
@@ -528,61 +798,93 @@ async def on_file_deleted(
     1. Just delete locally, no need to notify others
     """
     try:
+        if not file.filename:
+            return
+
         # Get project ID
-        project_id = await ProjectManager.get_project_id(context)
-        if not project_id or not file.filename:
+        project_id = await get_cached_project_id(context)
+        if not project_id:
             return
 
         # Get the conversation's role
-        role = await ConversationProjectManager.get_conversation_role(context)
+        role = await get_cached_role(context)
 
         # If role couldn't be determined, skip processing
         if not role:
-            logger.warning(f"Could not determine conversation role for file deletion: {file.filename}")
+            logger.warning("Could not determine conversation role for file deletion: %s", file.filename)
             return
 
+        # A pending update for the deleted file no longer needs to be processed
+        key = (project_id, str(context.id), file.filename)
+        _pending_file_args.pop(key, None)
+        pending = _pending_file_updates.pop(key, None)
+        if pending:
+            pending.cancel()
+
+        # Deleting and notifying can take a while, so do it in the background, after any creation or
+        # update of the file that is already being copied
+        start_file_event_task(project_id, file.filename, _process_file_deleted(context, project_id, file, role))
+
+    except Exception:
+        logger.exception("Error handling file deletion")
+
+
+async def _process_file_deleted(
+    context: ConversationContext, project_id: str, file: workbench_model.File, role: ProjectRole
+) -> None:
+    """
+    Processes a file deletion event in the background.
+    """
+    try:
+        filename = file.filename
+        is_coordinator = role == ProjectRole.COORDINATOR
+
         # Use ProjectFileManager for file operations
 
+        # Team conversations are only notified about Coordinator files
+        update_type = ""
+        notification = None
+
         # Process based on role
-        if role.value == "coordinator":
+        if is_coordinator:
             # For Coordinator files:
             # 1. Delete from project storage
-            logger.info(f"Deleting Coordinator file from project storage: {file.filename}")
+            logger.info("Deleting Coordinator file from project storage: %s", filename)
             success = await ProjectFileManager.delete_file_from_project_storage(
-                context=context, project_id=project_id, filename=file.filename
+                context=context, project_id=project_id, filename=filename
             )
 
             if not success:
-                logger.error(f"Failed to delete file from project storage: {file.filename}")
+                logger.error("Failed to delete file from project storage: %s", filename)
 
             # 2. Notify Team conversations to delete their copies
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
-                update_type="file_deleted",
-                message=f"Coordinator deleted a file: {file.filename}",
-                data={"filename": file.filename},
-            )
+            update_type = "file_deleted"
+            notification = f"Coordinator deleted a file: {filename}"
         else:
             # For Team files, no special handling needed
             # Just delete locally
-            logger.info(f"Team file deleted (not shared with project): {file.filename}")
+            logger.info("Team file deleted (not shared with project): %s", filename)
 
-        # Log file deletion to project log for all files
-        await ProjectStorage.log_project_event(
+        # Log file deletion to project log for all files, notifying Team conversations if needed
+        await ProjectStorage.log_and_notify(
             context=context,
             project_id=project_id,
             entry_type="file_deleted",
-            message=f"File deleted: {file.filename}",
+            message=f"File deleted: {filename}",
             metadata={
                 "file_id": getattr(file, "id", ""),
-                "filename": file.filename,
-                "is_coordinator_file": role.value == "coordinator",
+                "filename": filename,
+                "is_coordinator_file": is_coordinator,
             },
+            update_type=update_type,
+            notification=notification,
+            data={"filename": filename},
         )
 
-    except Exception as e:
-        logger.exception(f"Error handling file deletion: {e}")
+    except (OSError, ValidationError) as e:
+        logger.warning("Project storage error handling file deletion: %s", e)
+    except Exception:
+        logger.exception("Error handling file deletion")
 
 
 # Notice messages are now simpler without artifact abstraction
@@ -605,31 +907,36 @@ async def detect_assistant_role(context: ConversationContext) -> str:
     Returns:
         "coordinator" if in Coordinator Mode, "team" if in Team Mode
     """
+    detected = get_cache_entry(_role_detect_cache, context.id)
+    if detected:
+        return detected
+
     try:
         # First check if there's already a role set in project storage
-        role = await ConversationProjectManager.get_conversation_role(context)
+        role = await get_cached_role(context)
         if role:
+            set_cache_entry(_role_detect_cache, context.id, role.value)
             return role.value
 
         # Get project ID
-        project_id = await ProjectManager.get_project_id(context)
+        project_id = await get_cached_project_id(context)
         if not project_id:
-            # No project association yet, default to Coordinator
+            # No project association yet, default to Coordinator. This isn't cached, since the
+            # conversation may still join a project as a Team member
             return "coordinator"
 
-        # Check if this conversation created a project brief
-        briefing = ProjectStorage.read_project_brief(project_id)
-
-        # If the briefing was created by this conversation, we're in Coordinator Mode
-        if briefing and briefing.conversation_id == str(context.id):
-            return "coordinator"
+        # Last resort: check if this conversation created the project brief. If it did, we're in
+        # Coordinator Mode. Otherwise, if we have a project association but didn't create the
+        # briefing, we're likely in Team Mode
+        detected = "coordinator" if get_brief_owner(project_id) == str(context.id) else "team"
+        set_cache_entry(_role_detect_cache, context.id, detected)
+        return detected
 
-        # Otherwise, if we have a project association but didn't create the briefing,
-        # we're likely in Team Mode
-        return "team"
-
-    except Exception as e:
-        logger.exception(f"Error detecting assistant role: {e}")
+    except (OSError, ValidationError) as e:
+        logger.warning("Project storage error detecting assistant role: %s", e)
+        return "coordinator"
+    except Exception:
+        logger.exception("Error detecting assistant role")
         # Default to Coordinator Mode if detection fails
         return "coordinator"
 
@@ -640,40 +947,65 @@ async def on_conversation_created(context: ConversationContext) -> None:
     """
     Handle the event triggered when the assistant is added to a conversation.
     """
-    # Get conversation to access metadata
-    conversation = await context.get_conversation()
+    invalidate_project_cache(context)
+
+    # Get the conversation metadata, the preliminary role and the config concurrently. The role
+    # is detected from existing data, but we don't commit to it yet - that will happen during setup
+    conversation, role, config = await asyncio.gather(
+        context.get_conversation(),
+        detect_assistant_role(context),
+        assistant_config.get(context.assistant),
+    )
     metadata = conversation.metadata or {}
 
     # Set initial setup mode for new conversations
     metadata["setup_complete"] = False
     metadata["assistant_mode"] = "setup"
 
-    # Detect whether this is a Coordinator or Team conversation based on existing data
-    # but don't commit to a role yet - that will happen during setup
-    role = await detect_assistant_role(context)
-
     # Store the preliminary role in conversation metadata, but setup is not complete
     metadata["project_role"] = role
 
-    # Update conversation metadata
-    await context.send_conversation_state_event(
-        AssistantStateEvent(state_id="project_role", event="updated", state=None)
-    )
-
     # Use welcome message from config
-    config = await assistant_config.get(context.assistant)
     setup_welcome = config.welcome_message
 
-    # send the setup welcome message to the conversation
-    await context.send_messages(
-        NewConversationMessage(
-            content=setup_welcome,
-            message_type=MessageType.chat,
-            metadata={"generated_content": False},
-        )
+    # Update conversation metadata and send the setup welcome message to the conversation
+    await asyncio.gather(
+        context.send_conversation_state_event(
+            AssistantStateEvent(state_id="project_role", event="updated", state=None)
+        ),
+        context.send_messages(
+            NewConversationMessage(
+                content=setup_welcome,
+                message_type=MessageType.chat,
+                metadata={"generated_content": False},
+            )
+        ),
     )
 
 
+# In-flight file syncs for joining participants, keyed by conversation ID, so that
+# concurrent joins to the same conversation share one sync
+_file_sync_tasks: dict[str, asyncio.Task] = {}
+
+
+async def _sync_files_for_participant(context: ConversationContext, project_id: str, participant_name: str) -> None:
+    """
+    Synchronizes project files to a Team conversation after a team member joins.
+    """
+    try:
+        success = await ProjectFileManager.synchronize_files_to_team_conversation(
+            context=context, project_id=project_id
+        )
+
+        if success:
+            logger.info("Successfully synchronized files for returning team member: %s", participant_name)
+        else:
+            logger.warning("File synchronization failed for returning team member: %s", participant_name)
+
+    except Exception:
+        logger.exception("Error synchronizing files for participant")
+
+
 # Handle the event triggered when a participant joins a conversation
 @assistant.events.conversation.participant.on_created
 async def on_participant_joined(
@@ -686,7 +1018,10 @@ async def on_participant_joined(
     and automatically synchronize project files.
     """
     try:
-        logger.info(f"Participant joined event: {participant.id} ({participant.name})")
+        logger.info("Participant joined event: %s (%s)", participant.id, participant.name)
+
+        # The participant list has changed, so drop any cached names
+        _participants_cache.pop(context.id, None)
 
         # Skip the assistant's own join event
         if participant.id == context.assistant.id:
@@ -703,33 +1038,29 @@ async def on_participant_joined(
             return
 
         # Check if this is a Team conversation
-        role = await ConversationProjectManager.get_conversation_role(context)
+        role = await get_cached_role(context)
         if not role or role != ProjectRole.TEAM:
-            logger.debug(f"Not a Team conversation (role={role}), skipping file sync for participant")
+            logger.debug("Not a Team conversation (role=%s), skipping file sync for participant", role)
             return
 
         # Get project ID
-        project_id = await ConversationProjectManager.get_conversation_project(context)
+        project_id = await get_cached_project_id(context)
         if not project_id:
             logger.debug("No project ID found, skipping file sync for participant")
             return
 
-        logger.info(f"Team member {participant.name} joined project {project_id}, synchronizing files")
+        logger.info("Team member %s joined project %s, synchronizing files", participant.name, project_id)
 
-        # Automatically synchronize files from project storage to this conversation
-
-        success = await ProjectFileManager.synchronize_files_to_team_conversation(
-            context=context, project_id=project_id
-        )
-
-        if success:
-            logger.info(f"Successfully synchronized files for returning team member: {participant.name}")
+        # Automatically synchronize files from project storage to this conversation in the background,
+        # unless a sync for this conversation is already running
+        if context.id in _file_sync_tasks:
+            logger.debug("File sync already in progress for conversation %s", context.id)
         else:
-            logger.warning(f"File synchronization failed for returning team member: {participant.name}")
+            task = asyncio.create_task(_sync_files_for_participant(context, project_id, participant.name))
+            _file_sync_tasks[context.id] = task
+            task.add_done_callback(lambda _: _file_sync_tasks.pop(context.id, None))
 
         # Log the participant join event in the project log
-        from .project_data import LogEntryType
-
         await ProjectStorage.log_project_event(
             context=context,
             project_id=project_id,
@@ -742,8 +1073,8 @@ async def on_participant_joined(
             },
         )
 
-    except Exception as e:
-        logger.exception(f"Error handling participant join event: {e}")
+    except Exception:
+        logger.exception("Error handling participant join event")
 
 
 # The command handling functions have been moved to command_processor.py
@@ -752,6 +1083,88 @@ async def on_participant_joined(
 # OpenAI integration for message responses
 #
 
+# Token the model can respond with to skip its turn in multi-participant conversations
+SILENCE_TOKEN = "{{SILENCE}}"
+
+# Removes whitespace when checking for the silence token
+_WHITESPACE_TABLE = str.maketrans("", "", " \t\n\r")
+
+# Explicit lists of available tools for each role
+COORDINATOR_TOOLS = (
+    "get_project_info",
+    "create_project_brief",
+    "add_project_goal",
+    "resolve_information_request",
+    "mark_project_ready_for_working",
+    "suggest_next_action",
+)
+TEAM_TOOLS = (
+    "get_project_info",
+    "create_information_request",
+    "delete_information_request",
+    "update_project_dashboard",
+    "mark_criterion_completed",
+    "report_project_completion",
+    "detect_information_request_needs",
+    "suggest_next_action",
+    "view_coordinator_conversation",
+)
+COORDINATOR_TOOLS_STR = ", ".join(f"`{tool}`" for tool in COORDINATOR_TOOLS)
+TEAM_TOOLS_STR = ", ".join(f"`{tool}`" for tool in TEAM_TOOLS)
+
+# Completed responses for identical requests, keyed by a digest of the messages, model and token limit
+RESPONSE_CACHE_SIZE = 512
+_response_cache: OrderedDict[bytes, str] = OrderedDict()
+
+
+def get_response_cache_key(completion_args: dict[str, Any]) -> bytes:
+    """
+    Get the response cache key for a completion request.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(completion_args["messages"], sort_keys=True, default=str).encode())
+    digest.update(f"{completion_args['model']}:{completion_args['max_tokens']}".encode())
+    return digest.digest()
+
+
+def get_cached_response(key: bytes) -> str | None:
+    """
+    Get a cached response, marking it as recently used.
+    """
+    content = _response_cache.get(key)
+    if content is not None:
+        _response_cache.move_to_end(key)
+    return content
+
+
+def is_cacheable_response(tool_messages: list[ChatCompletionMessageParam]) -> bool:
+    """
+    Only plain answers are cached; responses that called tools had side effects.
+    """
+    return (
+        len(tool_messages) == 1
+        and not tool_messages[0].get("tool_calls")
+        and isinstance(tool_messages[0].get("content"), str)
+    )
+
+
+def cache_response(key: bytes, content: str) -> None:
+    """
+    Cache a response, evicting the least recently used one if the cache is full.
+    """
+    _response_cache[key] = content
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+# Limit on the whiteboard excerpt included in the prompt (roughly the 1500 characters it used to be)
+MAX_WHITEBOARD_PROMPT_TOKENS = 400
+
+# Markers for information requests in the prompt
+PRIORITY_MARKERS = {"low": "🔹", "medium": "🔶", "high": "🔴", "critical": "⚠️"}
+STATUS_MARKERS = {"new": "🆕", "acknowledged": "👁️", "in_progress": "⏳", "deferred": "⏱️"}
+
 
 async def respond_to_conversation(
     context: ConversationContext,
@@ -766,7 +1179,6 @@ async def respond_to_conversation(
     method_metadata_key = "respond_to_conversation"
     config = await assistant_config.get(context.assistant)
     participants_response = await context.get_participants(include_inactive=True)
-    silence_token = "{{SILENCE}}"
     system_message_content = config.guardrails_prompt
     system_message_content += f'\n\n{config.instruction_prompt}\n\nYour name is "{context.assistant.name}".'
     if role_specific_prompt:
@@ -786,7 +1198,7 @@ async def respond_to_conversation(
             " statement such as 'bye' or 'goodbye', or just a general acknowledgement like 'ok' or 'thanks'. Do not"
             f' respond as another user in the conversation, only as "{context.assistant.name}".'
             " Sometimes the other users need to talk amongst themselves and that is ok. If the conversation seems to"
-            f' be directed at you or the general audience, go ahead and respond.\n\nSay "{silence_token}" to skip'
+            f' be directed at you or the general audience, go ahead and respond.\n\nSay "{SILENCE_TOKEN}" to skip'
             " your turn."
         )
 
@@ -798,18 +1210,13 @@ async def respond_to_conversation(
     ]
 
     current_tokens = 0
-    current_tokens += get_token_count(system_message_content)
+    current_tokens += get_prompt_token_count(system_message_content)
+
+    participants_by_id = {participant.id: participant for participant in participants_response.participants}
 
     def format_message(message: ConversationMessage) -> str:
         """Consistent formatter that includes the participant name for multi-participant and name references"""
-        conversation_participant = next(
-            (
-                participant
-                for participant in participants_response.participants
-                if participant.id == message.sender.participant_id
-            ),
-            None,
-        )
+        conversation_participant = participants_by_id.get(message.sender.participant_id)
         participant_name = conversation_participant.name if conversation_participant else "unknown"
 
         message_datetime = message.timestamp.strftime("%Y-%m-%d %H:%M:%S")
@@ -818,32 +1225,42 @@ async def respond_to_conversation(
     messages_response = await context.get_messages(before=message.id)
     messages = messages_response.messages + [message]
 
-    history_messages: list[ChatCompletionMessageParam] = []
-    for message in reversed(messages):
-        message_tokens = get_token_count(format_message(message))
-        current_tokens += message_tokens
-        if current_tokens > config.request_config.max_tokens - config.request_config.response_tokens:
-            break
+    formatted_messages = [format_message(history_message) for history_message in messages]
+    message_tokens = [
+        get_message_token_count(str(history_message.id), formatted_message)
+        for history_message, formatted_message in zip(messages, formatted_messages)
+    ]
 
-        if message.sender.participant_id == context.assistant.id:
+    # Start from the full history and only drop the oldest messages if it doesn't fit
+    history_token_limit = config.request_config.max_tokens - config.request_config.response_tokens
+    current_tokens += sum(message_tokens)
+    first_message_index = 0
+    while current_tokens > history_token_limit and first_message_index < len(messages):
+        current_tokens -= message_tokens[first_message_index]
+        first_message_index += 1
+
+    history_messages: list[ChatCompletionMessageParam] = []
+    for history_message, formatted_message in zip(
+        messages[first_message_index:], formatted_messages[first_message_index:]
+    ):
+        if history_message.sender.participant_id == context.assistant.id:
             history_messages.append({
                 "role": "assistant",
-                "content": format_message(message),
+                "content": formatted_message,
             })
         else:
             history_messages.append({
                 "role": "user",
-                "content": format_message(message),
+                "content": formatted_message,
             })
 
-    history_messages.reverse()
-
     completion_messages.extend(history_messages)
 
-    # Get the conversation's role
-    from .project_storage import ConversationProjectManager
+    # project_tools imports assistant_config from this module, so it can't be imported at the top
     from .project_tools import ProjectTools, get_project_tools
 
+    # Get the conversation's role
+
     # First check conversation metadata
     conversation = await context.get_conversation()
     metadata = conversation.metadata or {}
@@ -872,382 +1289,415 @@ async def respond_to_conversation(
 
     logger.info(f"Using role: {role} for tool selection")
 
-    # For team role, analyze message for possible information request needs
+    # For team role, analyze message for possible information request needs. The detection makes its
+    # own LLM call, so start it now and let it run alongside the project data fetch and the response
+    detect_task = None
     if role == "team" and message.message_type == MessageType.chat:
         # Create a project tools instance for team role
         project_tools_instance = ProjectTools(context, role)
 
         # Check if the message indicates a potential information request
-        detection_result = await project_tools_instance.detect_information_request_needs(message.content)
-
-        # If an information request is detected with reasonable confidence
-        if detection_result.get("is_information_request", False) and detection_result.get("confidence", 0) > 0.5:
-            # Get detailed information from detection
-            suggested_title = detection_result.get("potential_title", "")
-            suggested_priority = detection_result.get("suggested_priority", "medium")
-            potential_description = detection_result.get("potential_description", "")
-            reason = detection_result.get("reason", "")
-
-            # Create a better-formatted suggestion using the detailed analysis
-            suggestion = (
-                f"**Information Request Detected**\n\n"
-                f"It appears that you might need information from the Coordinator. {reason}\n\n"
-                f"Would you like me to create an information request?\n"
-                f"**Title:** {suggested_title}\n"
-                f"**Description:** {potential_description}\n"
-                f"**Priority:** {suggested_priority}\n\n"
-                f"I can create this request for you, or you can use `/request-info` to create it yourself with custom details."
-            )
-
-            await context.send_messages(
-                NewConversationMessage(
-                    content=suggestion,
-                    message_type=MessageType.notice,
-                )
-            )
+        detect_task = asyncio.create_task(project_tools_instance.detect_information_request_needs(message.content))
 
-    # Create tool instance for the current role
-    project_tools = await get_project_tools(context, role)
-
-    # Define explicit lists of available tools for each role
-    coordinator_available_tools = [
-        "get_project_info",
-        "create_project_brief",
-        "add_project_goal",
-        "resolve_information_request",
-        "mark_project_ready_for_working",
-        "suggest_next_action",
-    ]
-
-    team_available_tools = [
-        "get_project_info",
-        "create_information_request",
-        "delete_information_request",
-        "update_project_dashboard",
-        "mark_criterion_completed",
-        "report_project_completion",
-        "detect_information_request_needs",
-        "suggest_next_action",
-        "view_coordinator_conversation",
-    ]
-
-    # Get the available tools for the current role
-    available_tools = coordinator_available_tools if role == "coordinator" else team_available_tools
+    try:
+        # Create tool instance for the current role
+        project_tools = await get_project_tools(context, role)
 
-    # Create a string listing available tools for the current role
-    available_tools_str = ", ".join([f"`{tool}`" for tool in available_tools])
+        # Get the string listing available tools for the current role
+        available_tools_str = COORDINATOR_TOOLS_STR if role == "coordinator" else TEAM_TOOLS_STR
 
-    # Generate a response from the AI model with tools
-    async with openai_client.create_client(config.service_config, api_version="2024-06-01") as client:
-        try:
-            # Create a completion dictionary for tool call handling
-            completion_args = {
-                "messages": completion_messages,
-                "model": config.request_config.openai_model,
-                "max_tokens": config.request_config.response_tokens,
-            }
-
-            # If the messaging API version supports tool functions, use them
+        # Generate a response from the AI model with tools
+        async with openai_client.create_client(config.service_config, api_version="2024-06-01") as client:
             try:
-                from openai_client.tools import complete_with_tool_calls
-
-                # Call the completion API with tool functions
-                logger.info(f"Using tool functions for completions (role: {role})")
-
-                # Record the tool names available for this role for validation
-                available_tool_names = set(project_tools.tool_functions.function_map.keys())
-                logger.info(f"Available tools for {role}: {available_tool_names}")
+                # Create a completion dictionary for tool call handling
+                completion_args = {
+                    "messages": completion_messages,
+                    "model": config.request_config.openai_model,
+                    "max_tokens": config.request_config.response_tokens,
+                }
+
+                # If the messaging API version supports tool functions, use them
+                try:
+                    # Call the completion API with tool functions
+                    logger.info(f"Using tool functions for completions (role: {role})")
 
-                # Import required modules at the beginning to avoid scope issues
-                from .project_data import RequestStatus
-                from .project_manager import ProjectManager
-                from .project_storage import ProjectStorage
+                    # Record the tool names available for this role for validation
+                    available_tool_names = set(project_tools.tool_functions.function_map.keys())
+                    logger.info(f"Available tools for {role}: {available_tool_names}")
 
-                # Get the project ID and data for both role types
-                project_id = None
-                project_data = {}
-                all_requests = []  # Initialize empty list to avoid "possibly unbound" errors
+                    # Get the project ID and data for both role types
+                    project_id = None
+                    project_data = {}
+                    active_requests = []  # Initialize empty list to avoid "possibly unbound" errors
 
-                try:
-                    # Get project ID
-                    project_id = await ProjectManager.get_project_id(context)
-                    if project_id:
-                        # Get comprehensive project data for prompt
-                        briefing = ProjectStorage.read_project_brief(project_id)
-                        status = ProjectStorage.read_project_dashboard(project_id)
-                        whiteboard = ProjectStorage.read_project_whiteboard(project_id)
-                        all_requests = ProjectStorage.get_all_information_requests(project_id)
-
-                        # Format project brief
-                        project_brief_text = ""
-                        if briefing:
-                            project_brief_text = f"""
-### PROJECT BRIEF
-**Name:** {briefing.project_name}
-**Description:** {briefing.project_description}
-
-#### PROJECT GOALS:
-"""
-                            for i, goal in enumerate(briefing.goals):
-                                # Count completed criteria
-                                completed = sum(1 for c in goal.success_criteria if c.completed)
-                                total = len(goal.success_criteria)
-
-                                project_brief_text += f"{i + 1}. **{goal.name}** - {goal.description}\n"
-                                if goal.success_criteria:
-                                    project_brief_text += f"   Progress: {completed}/{total} criteria complete\n"
-                                    for j, criterion in enumerate(goal.success_criteria):
-                                        check = "✅" if criterion.completed else "⬜"
-                                        project_brief_text += f"   {check} {criterion.description}\n"
-                                project_brief_text += "\n"
-
-                        # Format project dashboard
-                        project_dashboard_text = ""
-                        if status:
-                            project_dashboard_text = f"""
-### PROJECT DASHBOARD
-**Current State:** {status.state.value}
-"""
-                            if status.progress_percentage is not None:
-                                project_dashboard_text += f"**Overall Progress:** {status.progress_percentage}%\n"
-                            if status.status_message:
-                                project_dashboard_text += f"**Status Message:** {status.status_message}\n"
-                            if status.next_actions:
-                                project_dashboard_text += "\n**Next Actions:**\n"
-                                for action in status.next_actions:
-                                    project_dashboard_text += f"- {action}\n"
-
-                        # Format whiteboard content
-                        whiteboard_text = ""
-                        if whiteboard and whiteboard.content:
-                            whiteboard_text = "\n### PROJECT WHITEBOARD\n"
-
-                            # Truncate content if too long
-                            content = whiteboard.content
-                            max_length = 1500  # Arbitrary limit for context
-                            if len(content) > max_length:
-                                content = content[:max_length] + "... (content truncated for brevity)"
-                            whiteboard_text += f"{content}\n\n"
-
-                            whiteboard_text += (
-                                '*Use get_project_info(info_type="whiteboard") to see the full whiteboard content.*\n'
+                    try:
+                        # Get project ID
+                        project_id = await ProjectManager.get_project_id(context)
+                        if project_id:
+                            # Get comprehensive project data for prompt. These reads stay on the event loop:
+                            # the storage model cache is not thread-safe
+                            briefing = ProjectStorage.read_project_brief(project_id)
+                            status = ProjectStorage.read_project_dashboard(project_id)
+                            whiteboard = ProjectStorage.read_project_whiteboard(project_id)
+                            active_requests = ProjectStorage.query_information_requests(
+                                project_id, exclude_statuses={RequestStatus.RESOLVED}
                             )
 
-                        # Store the formatted data
-                        project_data = {
-                            "briefing": project_brief_text,
-                            "status": project_dashboard_text,
-                            "whiteboard": whiteboard_text,
-                        }
+                            # Format project brief
+                            project_brief_text = ""
+                            if briefing:
+                                brief_parts = [
+                                    f"""
+    ### PROJECT BRIEF
+    **Name:** {briefing.project_name}
+    **Description:** {briefing.project_description}
 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch project data for prompt: {e}")
+    #### PROJECT GOALS:
+    """
+                                ]
+                                for i, goal in enumerate(briefing.goals, start=1):
+                                    brief_parts.append(f"{i}. **{goal.name}** - {goal.description}\n")
+
+                                    criteria = goal.success_criteria
+                                    if criteria:
+                                        # Render the criteria and count the completed ones in a single pass
+                                        completed = 0
+                                        criteria_lines = []
+                                        for criterion in criteria:
+                                            if criterion.completed:
+                                                completed += 1
+                                                criteria_lines.append(f"   ✅ {criterion.description}\n")
+                                            else:
+                                                criteria_lines.append(f"   ⬜ {criterion.description}\n")
+
+                                        brief_parts.append(
+                                            f"   Progress: {completed}/{len(criteria)} criteria complete\n"
+                                        )
+                                        brief_parts.extend(criteria_lines)
+                                    brief_parts.append("\n")
+                                project_brief_text = "".join(brief_parts)
+
+                            # Format project dashboard
+                            project_dashboard_text = ""
+                            if status:
+                                dashboard_parts = [
+                                    f"""
+    ### PROJECT DASHBOARD
+    **Current State:** {status.state.value}
+    """
+                                ]
+                                if status.progress_percentage is not None:
+                                    dashboard_parts.append(f"**Overall Progress:** {status.progress_percentage}%\n")
+                                if status.status_message:
+                                    dashboard_parts.append(f"**Status Message:** {status.status_message}\n")
+                                if status.next_actions:
+                                    dashboard_parts.append("\n**Next Actions:**\n")
+                                    dashboard_parts.extend(f"- {action}\n" for action in status.next_actions)
+                                project_dashboard_text = "".join(dashboard_parts)
+
+                            # Format whiteboard content
+                            whiteboard_text = ""
+                            if whiteboard and whiteboard.content:
+                                whiteboard_text = "\n### PROJECT WHITEBOARD\n"
+
+                                # Truncate content if too long
+                                content = truncate_to_tokens(whiteboard.content, MAX_WHITEBOARD_PROMPT_TOKENS)
+                                if len(content) < len(whiteboard.content):
+                                    content += "... (content truncated for brevity)"
+                                whiteboard_text += f"{content}\n\n"
+
+                                whiteboard_text += (
+                                    '*Use get_project_info(info_type="whiteboard") '
+                                    "to see the full whiteboard content.*\n"
+                                )
 
-                # Construct role-specific messages with comprehensive project data
-                if role == "coordinator":
-                    # Format requests for Coordinator view
-                    information_requests_text = ""
-                    if project_id and all_requests:
-                        active_requests = [r for r in all_requests if r.status != RequestStatus.RESOLVED]
+                            # Store the formatted data
+                            project_data = {
+                                "briefing": project_brief_text,
+                                "status": project_dashboard_text,
+                                "whiteboard": whiteboard_text,
+                            }
 
-                        if active_requests:
-                            information_requests_text = "\n\n### ACTIVE INFORMATION REQUESTS\n"
-                            information_requests_text += (
-                                "> 📋 **Use the request ID (not the title) with resolve_information_request()**\n\n"
-                            )
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch project data for prompt: {e}")
+
+                    # Construct role-specific messages with comprehensive project data
+                    if role == "coordinator":
+                        # Format requests for Coordinator view
+                        information_requests_text = ""
+                        if project_id and active_requests:
+                            request_parts = [
+                                "\n\n### ACTIVE INFORMATION REQUESTS\n",
+                                "> 📋 **Use the request ID (not the title) with resolve_information_request()**\n\n",
+                            ]
 
                             for req in active_requests[:10]:  # Limit to 10 for brevity
-                                priority_marker = {"low": "🔹", "medium": "🔶", "high": "🔴", "critical": "⚠️"}.get(
-                                    req.priority.value, "🔹"
-                                )
+                                priority_marker = PRIORITY_MARKERS.get(req.priority.value, "🔹")
 
-                                information_requests_text += f"{priority_marker} **{req.title}** ({req.status.value})\n"
-                                information_requests_text += f"   **Request ID:** `{req.request_id}`\n"
-                                information_requests_text += f"   **Description:** {req.description}\n\n"
+                                request_parts.append(f"{priority_marker} **{req.title}** ({req.status.value})\n")
+                                request_parts.append(f"   **Request ID:** `{req.request_id}`\n")
+                                request_parts.append(f"   **Description:** {req.description}\n\n")
 
                             if len(active_requests) > 10:
-                                information_requests_text += f'*...and {len(active_requests) - 10} more requests. Use get_project_info(info_type="requests") to see all.*\n'
-
-                    # Combine all project data for Coordinator
-                    project_data_text = ""
-                    if project_data:
-                        project_data_text = f"""
-\n\n## CURRENT PROJECT INFORMATION
-{project_data.get("briefing", "")}
-{project_data.get("status", "")}
-{information_requests_text}
-{project_data.get("whiteboard", "")}
-"""
-
-                    role_enforcement = f"""
-\n\n⚠️ TOOL ACCESS ⚠️
-
-As a Coordinator, you can use these tools: {available_tools_str}
-{project_data_text}
-"""
-                else:  # team role
-                    # Fetch current information requests for this conversation
-                    information_requests_info = ""
-                    my_requests = []
-
-                    if project_id and all_requests:
-                        # Filter for requests from this conversation that aren't resolved
-                        my_requests = [
-                            r
-                            for r in all_requests
-                            if r.conversation_id == str(context.id) and r.status != RequestStatus.RESOLVED
-                        ]
-
-                        if my_requests:
-                            information_requests_info = "\n\n### YOUR CURRENT INFORMATION REQUESTS:\n"
-                            for req in my_requests:
-                                information_requests_info += (
+                                request_parts.append(
+                                    f'*...and {len(active_requests) - 10} more requests. Use get_project_info(info_type="requests") to see all.*\n'
+                                )
+                            information_requests_text = "".join(request_parts)
+
+                        # Combine all project data for Coordinator
+                        project_data_text = ""
+                        if project_data:
+                            project_data_text = f"""
+    \n\n## CURRENT PROJECT INFORMATION
+    {project_data.get("briefing", "")}
+    {project_data.get("status", "")}
+    {information_requests_text}
+    {project_data.get("whiteboard", "")}
+    """
+
+                        role_enforcement = f"""
+    \n\n⚠️ TOOL ACCESS ⚠️
+
+    As a Coordinator, you can use these tools: {available_tools_str}
+    """
+                    else:  # team role
+                        # Fetch current information requests for this conversation
+                        information_requests_info = ""
+                        my_requests = []
+
+                        if project_id and active_requests:
+                            # Filter for requests from this conversation that aren't resolved
+                            my_requests = [r for r in active_requests if r.conversation_id == str(context.id)]
+
+                            if my_requests:
+                                request_parts = ["\n\n### YOUR CURRENT INFORMATION REQUESTS:\n"]
+                                request_parts.extend(
                                     f"- **{req.title}** (ID: `{req.request_id}`, Priority: {req.priority})\n"
+                                    for req in my_requests
                                 )
-                            information_requests_info += '\nYou can delete any of these requests using `delete_information_request(request_id="the_id")`\n'
-
-                    # Format requests from all conversations for team view
-                    all_information_requests_text = ""
-                    if project_id and all_requests:
-                        # Show all active requests including those from other team members
-                        other_active_requests = [
-                            r
-                            for r in all_requests
-                            if r.conversation_id != str(context.id) and r.status != RequestStatus.RESOLVED
-                        ]
-
-                        if other_active_requests:
-                            all_information_requests_text = "\n\n### OTHER ACTIVE INFORMATION REQUESTS:\n"
-                            all_information_requests_text += "> These are requests from other team members\n\n"
-
-                            for req in other_active_requests[:5]:  # Limit to 5 for brevity
-                                status_marker = {
-                                    "new": "🆕",
-                                    "acknowledged": "👁️",
-                                    "in_progress": "⏳",
-                                    "deferred": "⏱️",
-                                }.get(req.status.value, "📋")
-
-                                all_information_requests_text += (
-                                    f"{status_marker} **{req.title}** (Status: {req.status.value})\n"
+                                request_parts.append(
+                                    '\nYou can delete any of these requests using `delete_information_request(request_id="the_id")`\n'
                                 )
-                                all_information_requests_text += f"   **Description:** {req.description}\n\n"
-
-                            if len(other_active_requests) > 5:
-                                all_information_requests_text += f'*...and {len(other_active_requests) - 5} more requests. Use get_project_info(info_type="requests") to see all.*\n'
-
-                    # Combine all project data for team
-                    project_data_text = ""
-                    if project_data:
-                        project_data_text = f"""
-\n\n## CURRENT PROJECT INFORMATION
-{project_data.get("briefing", "")}
-{project_data.get("status", "")}
-{information_requests_info}
-{all_information_requests_text}
-{project_data.get("whiteboard", "")}
-"""
-
-                    role_enforcement = f"""
-\n\n⚠️ TOOL ACCESS ⚠️
-
-As a TEAM member, you can use these tools: {available_tools_str}
-
-When working with information requests:
-1. Use the `create_information_request` tool to send requests for information to the Coordinator
-2. Use the `delete_information_request` tool if you need to remove a request you created
-3. Always note request IDs when creating requests - you'll need them for deletion
-
-If you need information from the Coordinator, first try viewing recent Coordinator messages with the `view_coordinator_conversation` tool.
-{project_data_text}
-"""
-
-                # Append the enforcement text to the role_specific_prompt
-                role_specific_prompt += role_enforcement
-
-                # Update the system message to include the enhanced role_specific_prompt
-                system_message_content += f"\n\n{role_enforcement}"
-
-                # Update the system message in completion_args with the new content
-                completion_args["messages"][0]["content"] = system_message_content
-
-                # Make the API call
-                tool_completion, tool_messages = await complete_with_tool_calls(
-                    async_client=client,
-                    completion_args=completion_args,
-                    tool_functions=project_tools.tool_functions,
-                    metadata=metadata,
-                )
+                                information_requests_info = "".join(request_parts)
+
+                        # Format requests from all conversations for team view
+                        all_information_requests_text = ""
+                        if project_id and active_requests:
+                            # Show all active requests including those from other team members
+                            other_active_requests = [r for r in active_requests if r.conversation_id != str(context.id)]
+
+                            if other_active_requests:
+                                other_request_parts = [
+                                    "\n\n### OTHER ACTIVE INFORMATION REQUESTS:\n",
+                                    "> These are requests from other team members\n\n",
+                                ]
+
+                                for req in other_active_requests[:5]:  # Limit to 5 for brevity
+                                    status_marker = STATUS_MARKERS.get(req.status.value, "📋")
+
+                                    other_request_parts.append(
+                                        f"{status_marker} **{req.title}** (Status: {req.status.value})\n"
+                                    )
+                                    other_request_parts.append(f"   **Description:** {req.description}\n\n")
+
+                                if len(other_active_requests) > 5:
+                                    other_request_parts.append(
+                                        f'*...and {len(other_active_requests) - 5} more requests. Use get_project_info(info_type="requests") to see all.*\n'
+                                    )
+                                all_information_requests_text = "".join(other_request_parts)
+
+                        # Combine all project data for team
+                        project_data_text = ""
+                        if project_data:
+                            project_data_text = f"""
+    \n\n## CURRENT PROJECT INFORMATION
+    {project_data.get("briefing", "")}
+    {project_data.get("status", "")}
+    {information_requests_info}
+    {all_information_requests_text}
+    {project_data.get("whiteboard", "")}
+    """
 
-                # Get the final assistant message content
-                content = None
-                for msg in tool_messages:
-                    if msg["role"] == "assistant" and "content" in msg and msg["content"]:
-                        content = msg["content"]
+                        role_enforcement = f"""
+    \n\n⚠️ TOOL ACCESS ⚠️
 
-                if not content:
-                    # Fallback if no final message was generated
-                    content = "I've processed your request, but couldn't generate a proper response."
+    As a TEAM member, you can use these tools: {available_tools_str}
 
-                # Add tool call message exchange to metadata for debugging
-                deepmerge.always_merger.merge(
-                    metadata,
-                    {
-                        "debug": {
-                            f"{method_metadata_key}": {
-                                "request": completion_args,
-                                "tool_messages": str(tool_messages),
-                                "response": tool_completion.model_dump()
-                                if tool_completion
-                                else "[no response from openai]",
+    When working with information requests:
+    1. Use the `create_information_request` tool to send requests for information to the Coordinator
+    2. Use the `delete_information_request` tool if you need to remove a request you created
+    3. Always note request IDs when creating requests - you'll need them for deletion
+
+    If you need information from the Coordinator, first try viewing recent Coordinator messages with the `view_coordinator_conversation` tool.
+    """
+
+                    # Append the enforcement text to the role_specific_prompt
+                    role_specific_prompt += role_enforcement
+
+                    # Update the system message to include the enhanced role_specific_prompt
+                    system_message_content += f"\n\n{role_enforcement}"
+
+                    # Update the system message in completion_args with the new content
+                    completion_args["messages"][0]["content"] = system_message_content
+
+                    # The project data changes from turn to turn, so it goes after the history in its own
+                    # message. This keeps the system prompt and history a stable prefix that OpenAI can
+                    # serve from its prompt cache
+                    if project_data_text:
+                        completion_args["messages"].append({
+                            "role": "system",
+                            "content": project_data_text,
+                        })
+
+                    # Identical prompts can be answered from the response cache, if enabled
+                    response_cache_key = None
+                    cached_content = None
+                    if config.request_config.enable_response_cache:
+                        response_cache_key = get_response_cache_key(completion_args)
+                        cached_content = get_cached_response(response_cache_key)
+
+                    if cached_content is not None:
+                        content = cached_content
+                        deepmerge.always_merger.merge(
+                            metadata,
+                            {
+                                "debug": {
+                                    f"{method_metadata_key}": {
+                                        "request": completion_args,
+                                        "response_cache_hit": True,
+                                    },
+                                }
                             },
-                        }
-                    },
-                )
+                        )
+                    else:
+                        # Make the API call
+                        tool_completion, tool_messages = await complete_with_tool_calls(
+                            async_client=client,
+                            completion_args=completion_args,
+                            tool_functions=project_tools.tool_functions,
+                            metadata=metadata,
+                        )
 
-            except (ImportError, AttributeError):
-                # Fallback to standard completions if tool calls aren't supported
-                logger.info("Tool functions not supported, falling back to standard completion")
+                        if tool_completion and tool_completion.usage and tool_completion.usage.prompt_tokens_details:
+                            logger.debug(
+                                "Prompt cache: %s of %s prompt tokens cached",
+                                tool_completion.usage.prompt_tokens_details.cached_tokens,
+                                tool_completion.usage.prompt_tokens,
+                            )
 
-                # Call the OpenAI chat completion endpoint to get a response
-                completion = await client.chat.completions.create(**completion_args)
+                        # Get the final assistant message content
+                        content = None
+                        for msg in tool_messages:
+                            if msg["role"] == "assistant" and "content" in msg and msg["content"]:
+                                content = msg["content"]
+
+                        if not content:
+                            # Fallback if no final message was generated
+                            content = "I've processed your request, but couldn't generate a proper response."
+
+                        # Add tool call message exchange to metadata for debugging
+                        deepmerge.always_merger.merge(
+                            metadata,
+                            {
+                                "debug": {
+                                    f"{method_metadata_key}": {
+                                        "request": completion_args,
+                                        "tool_messages": tool_messages,
+                                        "response": tool_completion.model_dump()
+                                        if tool_completion
+                                        else "[no response from openai]",
+                                    },
+                                }
+                            },
+                        )
 
-                # Get the content from the completion response
-                content = completion.choices[0].message.content
+                        if response_cache_key and isinstance(content, str) and is_cacheable_response(tool_messages):
+                            cache_response(response_cache_key, content)
+
+                except AttributeError:
+                    # Fallback to standard completions if tool calls aren't supported
+                    logger.info("Tool functions not supported, falling back to standard completion")
+
+                    # Call the OpenAI chat completion endpoint to get a response
+                    completion = await client.chat.completions.create(**completion_args)
+
+                    # Get the content from the completion response
+                    content = completion.choices[0].message.content
+
+                    # Merge the completion response into the passed in metadata
+                    deepmerge.always_merger.merge(
+                        metadata,
+                        {
+                            "debug": {
+                                f"{method_metadata_key}": {
+                                    "request": completion_args,
+                                    "response": completion.model_dump() if completion else "[no response from openai]",
+                                },
+                            }
+                        },
+                    )
 
-                # Merge the completion response into the passed in metadata
+            except Exception as e:
+                logger.exception("exception occurred calling openai chat completion")
+                # if there is an error, set the content to an error message
+                content = "An error occurred while calling the OpenAI API. Is it configured correctly?"
+
+                # merge the error into the passed in metadata
                 deepmerge.always_merger.merge(
                     metadata,
                     {
                         "debug": {
                             f"{method_metadata_key}": {
-                                "request": completion_args,
-                                "response": completion.model_dump() if completion else "[no response from openai]",
+                                "request": {
+                                    "model": config.request_config.openai_model,
+                                    "messages": completion_messages,
+                                },
+                                "error": str(e),
                             },
                         }
                     },
                 )
 
-        except Exception as e:
-            logger.exception(f"exception occurred calling openai chat completion: {e}")
-            # if there is an error, set the content to an error message
-            content = "An error occurred while calling the OpenAI API. Is it configured correctly?"
-
-            # merge the error into the passed in metadata
-            deepmerge.always_merger.merge(
-                metadata,
-                {
-                    "debug": {
-                        f"{method_metadata_key}": {
-                            "request": {
-                                "model": config.request_config.openai_model,
-                                "messages": completion_messages,
-                            },
-                            "error": str(e),
-                        },
-                    }
-                },
-            )
+        # Suggest an information request before the response, if the detection found one
+        if detect_task:
+            try:
+                detection_result = await detect_task
+            except Exception:
+                # The detection is only a suggestion, so carry on with the response without it
+                logger.exception("Error detecting information request needs")
+                detection_result = {}
+
+            # If an information request is detected with reasonable confidence
+            if detection_result.get("is_information_request", False) and detection_result.get("confidence", 0) > 0.5:
+                # Get detailed information from detection
+                suggested_title = detection_result.get("potential_title", "")
+                suggested_priority = detection_result.get("suggested_priority", "medium")
+                potential_description = detection_result.get("potential_description", "")
+                reason = detection_result.get("reason", "")
+
+                # Create a better-formatted suggestion using the detailed analysis
+                suggestion = (
+                    f"**Information Request Detected**\n\n"
+                    f"It appears that you might need information from the Coordinator. {reason}\n\n"
+                    f"Would you like me to create an information request?\n"
+                    f"**Title:** {suggested_title}\n"
+                    f"**Description:** {potential_description}\n"
+                    f"**Priority:** {suggested_priority}\n\n"
+                    f"I can create this request for you, or you can use `/request-info` to create it yourself with custom details."
+                )
+
+                await context.send_messages(
+                    NewConversationMessage(
+                        content=suggestion,
+                        message_type=MessageType.notice,
+                    )
+                )
+    finally:
+        # Don't leave the detection running, or its failure unretrieved, if the response failed before it was used
+        if detect_task and not detect_task.done():
+            detect_task.cancel()
+        elif detect_task and not detect_task.cancelled():
+            detect_task.exception()
 
     # set the message type based on the content
     message_type = MessageType.chat
@@ -1256,12 +1706,12 @@ If you need information from the Coordinator, first try viewing recent Coordinat
     if content:
         # strip out the username from the response
         if isinstance(content, str) and content.startswith("["):
-            content = re.sub(r"\[.*\]:\s", "", content)
+            content = _USERNAME_PREFIX_PATTERN.sub("", content, count=1)
 
         # check for the silence token, in case the model chooses not to respond
-        # model sometimes puts extra spaces in the response, so remove them
+        # model sometimes puts extra whitespace in the response, so remove it
         # when checking for the silence token
-        if isinstance(content, str) and content.replace(" ", "") == silence_token:
+        if isinstance(content, str) and content.translate(_WHITESPACE_TABLE) == SILENCE_TOKEN:
             # normal behavior is to not respond if the model chooses to remain silent
             # but we can override this behavior for debugging purposes via the assistant config
             if config.enable_debug_output:
@@ -1303,55 +1753,104 @@ If you need information from the Coordinator, first try viewing recent Coordinat
 
     # Manually capture assistant's message for Coordinator conversation storage
     # This ensures that both user and assistant messages are stored
-    from .project_storage import ConversationProjectManager
 
-    # Get the authoritative role directly from storage, not from metadata
-    stored_role = await ConversationProjectManager.get_conversation_role(context)
-    role = stored_role.value if stored_role else None
+    # Use the authoritative role read from storage earlier, not from metadata
+    role = stored_role_value
 
     if role == "coordinator" and message_type == MessageType.chat and response_message and response_message.messages:
         try:
             # Get the project ID
-            from .project_manager import ProjectManager
-
-            project_id = await ProjectManager.get_project_id(context)
+            project_id = await get_cached_project_id(context)
 
             if project_id:
-                for msg in response_message.messages:
-                    # Store the assistant's message for Team access
-                    from .project_storage import ProjectStorage
+                # Queue the assistant's messages for Team access in one go
+                CoordinatorMessageBatcher.enqueue_messages(
+                    project_id,
+                    [
+                        CoordinatorConversationMessage(
+                            message_id=str(msg.id),
+                            content=msg.content,
+                            sender_name=context.assistant.name,
+                            is_assistant=True,
+                            timestamp=msg.timestamp,
+                        )
+                        for msg in response_message.messages
+                    ],
+                )
+                logger.info(f"Queued {len(response_message.messages)} Coordinator assistant message(s) for Team access")
+
+                # Automatically update the whiteboard after assistant messages. This makes its own
+                # LLM call, so run it in the background rather than holding up the response
+                # The history already in hand plus the sent response covers the recent messages
+                recent_messages = (messages + list(response_message.messages))[-10:]
+                schedule_whiteboard_update(context, project_id, recent_messages)
+        except Exception:
+            # Don't fail message handling if storage fails
+            logger.exception("Error storing Coordinator assistant message for Team access")
 
-                    ProjectStorage.append_coordinator_message(
-                        project_id=project_id,
-                        message_id=str(msg.id),
-                        content=msg.content,
-                        sender_name=context.assistant.name,
-                        is_assistant=True,
-                        timestamp=msg.timestamp,
-                    )
-                    logger.info(f"Stored Coordinator assistant message for Team access: {msg.id}")
 
-                    # Automatically update the whiteboard after assistant messages
-                    try:
-                        # Get recent messages for analysis
-                        recent_messages = await context.get_messages(limit=10)  # Adjust limit as needed
+# Seconds without a newer response before the whiteboard is updated, so a burst of responses makes one LLM call
+WHITEBOARD_UPDATE_DELAY_SECONDS = 2.0
 
-                        # Call the whiteboard update method
-                        whiteboard_success, whiteboard = await ProjectManager.auto_update_whiteboard(
-                            context=context,
-                            chat_history=recent_messages.messages,
-                        )
+# Strong references to in-flight whiteboard updates so they are not garbage collected
+_whiteboard_update_tasks: set[asyncio.Task] = set()
+# Whiteboard updates still waiting out their delay, keyed by project ID
+_pending_whiteboard_updates: dict[str, asyncio.Task] = {}
 
-                        if whiteboard_success:
-                            logger.info(f"Auto-updated whiteboard for project {project_id}")
-                        else:
-                            logger.info("Whiteboard auto-update did not apply any changes")
-                    except Exception as e:
-                        # Don't fail message handling if whiteboard update fails
-                        logger.exception(f"Error auto-updating whiteboard: {e}")
-        except Exception as e:
-            # Don't fail message handling if storage fails
-            logger.exception(f"Error storing Coordinator assistant message for Team access: {e}")
+
+def schedule_whiteboard_update(
+    context: ConversationContext, project_id: str, recent_messages: list[ConversationMessage]
+) -> None:
+    """
+    Schedules a background whiteboard update, replacing any update for the project that hasn't started yet.
+
+    The newest messages include everything the replaced update would have analyzed.
+    """
+    previous = _pending_whiteboard_updates.pop(project_id, None)
+    if previous:
+        previous.cancel()
+
+    task = asyncio.create_task(_auto_update_whiteboard(context, project_id, recent_messages))
+    _pending_whiteboard_updates[project_id] = task
+    _whiteboard_update_tasks.add(task)
+    task.add_done_callback(_whiteboard_update_tasks.discard)
+
+
+async def _auto_update_whiteboard(
+    context: ConversationContext, project_id: str, recent_messages: list[ConversationMessage]
+) -> None:
+    """
+    Updates the project whiteboard from the recent Coordinator conversation.
+    """
+    await asyncio.sleep(WHITEBOARD_UPDATE_DELAY_SECONDS)
+
+    # Once started, the update runs to completion rather than being replaced by a newer one
+    if _pending_whiteboard_updates.get(project_id) is asyncio.current_task():
+        del _pending_whiteboard_updates[project_id]
+
+    try:
+        # Call the whiteboard update method
+        whiteboard_success, _ = await ProjectManager.auto_update_whiteboard(
+            context=context,
+            chat_history=recent_messages,
+            project_id=project_id,
+        )
+
+        if whiteboard_success:
+            logger.info(f"Auto-updated whiteboard for project {project_id}")
+        else:
+            logger.info("Whiteboard auto-update did not apply any changes")
+    except Exception:
+        # Don't fail message handling if whiteboard update fails
+        logger.exception("Error auto-updating whiteboard")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
+    """
+    Get a tiktoken encoding, building it only once per process.
+    """
+    return tiktoken.get_encoding(encoding_name)
 
 
 # this method is used to get the token count of a string.
@@ -1359,8 +1858,53 @@ def get_token_count(string: str) -> int:
     """
     Get the token count of a string.
     """
-    encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(string))
+    return len(_get_encoding().encode(string))
+
+
+def truncate_to_tokens(string: str, max_tokens: int) -> str:
+    """
+    Truncate a string to at most max_tokens tokens.
+    """
+    # Every token covers at least one UTF-8 byte, so short strings can't be over the limit
+    if len(string.encode("utf-8")) <= max_tokens:
+        return string
+
+    encoding = _get_encoding()
+    tokens = encoding.encode(string)
+    if len(tokens) <= max_tokens:
+        return string
+    return encoding.decode(tokens[:max_tokens])
+
+
+@functools.lru_cache(maxsize=32)
+def get_prompt_token_count(prompt: str) -> int:
+    """
+    Get the token count of a system prompt, which rarely changes between turns.
+    """
+    return get_token_count(prompt)
+
+
+# Token counts of formatted history messages, keyed by (message ID, hash of the formatted text),
+# so that each turn only tokenizes messages it hasn't seen before
+MESSAGE_TOKEN_CACHE_SIZE = 10_000
+_message_token_counts: OrderedDict[tuple[str, int], int] = OrderedDict()
+
+
+def get_message_token_count(message_id: str, formatted_message: str) -> int:
+    """
+    Get the token count of a formatted conversation message, tokenizing it only on a cache miss.
+    """
+    key = (message_id, hash(formatted_message))
+    count = _message_token_counts.get(key)
+    if count is not None:
+        _message_token_counts.move_to_end(key)
+        return count
+
+    count = get_token_count(formatted_message)
+    _message_token_counts[key] = count
+    if len(_message_token_counts) > MESSAGE_TOKEN_CACHE_SIZE:
+        _message_token_counts.popitem(last=False)
+    return count
 
 
 # endregion
@@ -43,6 +43,17 @@ class RequestConfig(BaseModel):
         Field(title="OpenAI Model", description="The OpenAI model to use for generating responses."),
     ] = "gpt-4o"
 
+    enable_response_cache: Annotated[
+        bool,
+        Field(
+            title="Enable Response Cache",
+            description=(
+                "Reuse the previous response when exactly the same prompt is sent again, instead of calling the model."
+                " Responses that called tools are never cached."
+            ),
+        ),
+    ] = False
+
 
 class CoordinatorConfig(BaseModel):
     model_config = ConfigDict(
@@ -206,7 +217,7 @@ Type `/help` for more information on available commands."""
             description="Automatically synchronize files between linked conversations.",
         ),
     ] = True
-    
+
     track_progress: Annotated[
         bool,
         Field(
@@ -246,4 +257,4 @@ Type `/help` for more information on available commands."""
             title="Team Configuration",
             description="Configuration for project team members.",
         ),
-    ] = TeamConfig()
\ No newline at end of file
+    ] = TeamConfig()
@@ -284,14 +284,7 @@ class CoordinatorConversationHandler:
         )
 
         # Update project dashboard if this was a blocker
-        dashboard = await ProjectManager.get_project_dashboard(self.context)
-        if dashboard and request_id in dashboard.active_requests:
-            dashboard.active_requests.remove(request_id)
-            dashboard.updated_at = datetime.utcnow()
-            dashboard.updated_by = user_id
-            dashboard.version += 1
-
-            ProjectStorage.write_project_dashboard(project_id, dashboard)
+        ProjectStorage.update_dashboard_active_requests(project_id, user_id, remove=[request_id])
 
         # Send notification
         await self.context.send_messages(
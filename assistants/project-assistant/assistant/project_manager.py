@@ -5,13 +5,24 @@ This module provides the core business logic for working with project data
 without relying on the artifact abstraction.
 """
 
+import asyncio
+import hashlib
 import logging
+import re
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
+import openai_client
+from openai import AsyncOpenAI
+from semantic_workbench_api_model.workbench_model import MessageType, NewConversationMessage, ParticipantRole
 from semantic_workbench_assistant.assistant_app import ConversationContext
+from semantic_workbench_assistant.config import (
+    ConfigSecretStrJsonSerializationMode,
+    config_secret_str_serialization_context,
+)
 
+from .conversation_clients import ConversationClientManager
 from .project_data import (
     InformationRequest,
     LogEntry,
@@ -28,15 +39,84 @@ from .project_data import (
 )
 from .project_storage import (
     ConversationProjectManager,
+    ProjectLogWriter,
     ProjectNotifier,
     ProjectRole,
     ProjectStorage,
     ProjectStorageManager,
 )
-from .utils import get_current_user, require_current_user
+from .utils import get_current_user, load_text_include, require_current_user
 
 logger = logging.getLogger(__name__)
 
+EntityT = TypeVar("EntityT")
+
+# Fields that updates must not change on each entity, and the fields they may change
+BRIEF_IMMUTABLE_FIELDS = frozenset({"created_by", "conversation_id", "created_at", "version"})
+REQUEST_PROTECTED_FIELDS = frozenset({"request_id", "created_by", "created_at", "conversation_id", "version"})
+BRIEF_MUTABLE_FIELDS = frozenset(ProjectBrief.model_fields) - BRIEF_IMMUTABLE_FIELDS
+REQUEST_MUTABLE_FIELDS = frozenset(InformationRequest.model_fields) - REQUEST_PROTECTED_FIELDS
+
+# Priorities at which a new information request is tracked as a blocker on the dashboard
+BLOCKING_PRIORITIES = frozenset({RequestPriority.HIGH, RequestPriority.CRITICAL})
+
+# Extracts the whiteboard content from the auto-update completion
+WHITEBOARD_CLOSE_TAG = "</WHITEBOARD>"
+WHITEBOARD_CONTENT_PATTERN = re.compile(r"<WHITEBOARD>(.*?)</WHITEBOARD>", re.DOTALL)
+
+# Whiteboard auto-update prompt for each assistant template, and the one used by all other templates
+WHITEBOARD_PROMPT_FILES = {"context_transfer": "context_transfer_whiteboard_prompt.txt"}
+DEFAULT_WHITEBOARD_PROMPT_FILE = "whiteboard_auto_update_prompt.txt"
+WHITEBOARD_PROMPT_FORMAT = "{template}\n\n<CHAT_HISTORY>\n{chat_history}</CHAT_HISTORY>\n"
+
+# Log entry types that are also announced to all linked conversations
+SIGNIFICANT_LOG_ENTRY_TYPES = frozenset({
+    LogEntryType.PROJECT_STARTED,
+    LogEntryType.PROJECT_COMPLETED,
+    LogEntryType.PROJECT_ABORTED,
+    LogEntryType.GOAL_COMPLETED,
+    LogEntryType.MILESTONE_PASSED,
+})
+
+# Significant log entry types whose announcement is awaited; the others are sent in the background
+AWAITED_LOG_ENTRY_TYPES = frozenset({LogEntryType.PROJECT_COMPLETED, LogEntryType.PROJECT_ABORTED})
+
+# Long-lived OpenAI clients for whiteboard updates, keyed by a hash of the service config (secrets
+# included) and the API version
+WHITEBOARD_API_VERSION = "2024-06-01"
+_whiteboard_clients: Dict[Tuple[bytes, str], AsyncOpenAI] = {}
+
+# Hash of the chat history behind each project's last successful whiteboard auto-update, keyed by project ID
+_whiteboard_input_hashes: Dict[str, bytes] = {}
+
+
+def _get_whiteboard_client(service_config: openai_client.ServiceConfig) -> AsyncOpenAI:
+    """Returns a cached client for the service config, creating it on first use."""
+    # Secrets are masked when serialized by default, so serialize the real values; configs that differ
+    # only in their key must not share a client. The hash keeps the secrets out of the cache's keys.
+    config_json = service_config.model_dump_json(
+        context=config_secret_str_serialization_context(ConfigSecretStrJsonSerializationMode.serialize_value)
+    )
+    key = (hashlib.sha256(config_json.encode()).digest(), WHITEBOARD_API_VERSION)
+    client = _whiteboard_clients.get(key)
+    if client is None:
+        client = openai_client.create_client(service_config, api_version=WHITEBOARD_API_VERSION)
+        _whiteboard_clients[key] = client
+    return client
+
+
+def _get_whiteboard_prompt_template(template_id: str) -> str:
+    """Returns the whiteboard auto-update prompt for an assistant template."""
+    return load_text_include(WHITEBOARD_PROMPT_FILES.get(template_id, DEFAULT_WHITEBOARD_PROMPT_FILE))
+
+
+async def close_whiteboard_clients() -> None:
+    """Closes the cached whiteboard clients; called on service shutdown."""
+    clients = list(_whiteboard_clients.values())
+    _whiteboard_clients.clear()
+    for client in clients:
+        await client.close()
+
 
 class ProjectManager:
     """
@@ -87,11 +167,11 @@ class ProjectManager:
             # Set this conversation as the Coordinator
             await ConversationProjectManager.set_conversation_role(context, project_id, ProjectRole.COORDINATOR)
 
-            logger.info(f"Created new project {project_id} for conversation {context.id}")
+            logger.info("Created new project %s for conversation %s", project_id, context.id)
             return True, project_id
 
-        except Exception as e:
-            logger.exception(f"Error creating project: {e}")
+        except Exception:
+            logger.exception("Error creating project")
             return False, ""
 
     @staticmethod
@@ -110,7 +190,7 @@ class ProjectManager:
         try:
             # Check if project exists
             if not ProjectStorageManager.project_exists(project_id):
-                logger.error(f"Cannot join project: project {project_id} does not exist")
+                logger.error("Cannot join project: project %s does not exist", project_id)
                 return False
 
             # Associate the conversation with the project
@@ -119,11 +199,11 @@ class ProjectManager:
             # Set the conversation role
             await ConversationProjectManager.set_conversation_role(context, project_id, role)
 
-            logger.info(f"Joined project {project_id} as {role.value}")
+            logger.info("Joined project %s as %s", project_id, role.value)
             return True
 
-        except Exception as e:
-            logger.exception(f"Error joining project: {e}")
+        except Exception:
+            logger.exception("Error joining project")
             return False
 
     @staticmethod
@@ -161,6 +241,45 @@ class ProjectManager:
         """
         return await ConversationProjectManager.get_conversation_role(context)
 
+    @staticmethod
+    async def _load_context(
+        context: ConversationContext,
+        operation_name: str,
+        entity_reader: Optional[Callable[[str], Optional[EntityT]]] = None,
+        project_id: Optional[str] = None,
+    ) -> Tuple[Optional[str], Optional[str], Optional[EntityT]]:
+        """
+        Loads the project ID, current user and (optionally) an entity for a mutating operation.
+
+        The project ID and user lookups are independent, so they run concurrently. The entity
+        read needs the project ID and runs once it is known.
+
+        Args:
+            context: Current conversation context
+            operation_name: Name of the operation, for error logging
+            entity_reader: Optional function that reads the entity for a project ID
+            project_id: Optional project ID already looked up by the caller, to skip the lookup
+
+        Returns:
+            Tuple of (project_id, user_id, entity). The project ID or user ID is None if it
+            couldn't be found (after logging an error), in which case no entity is read.
+        """
+        if project_id:
+            current_user_id = await require_current_user(context, operation_name)
+        else:
+            project_id, current_user_id = await asyncio.gather(
+                ProjectManager.get_project_id(context),
+                require_current_user(context, operation_name),
+            )
+        if not project_id:
+            logger.error("Cannot %s: no project associated with this conversation", operation_name)
+            return None, current_user_id, None
+
+        if not current_user_id or entity_reader is None:
+            return project_id, current_user_id, None
+
+        return project_id, current_user_id, entity_reader(project_id)
+
     @staticmethod
     async def get_project_brief(context: ConversationContext) -> Optional[ProjectBrief]:
         """
@@ -238,23 +357,18 @@ class ProjectManager:
             if not current_user_id:
                 return False, None
 
-            # Create project goals
-            project_goals = []
-            if goals:
-                for i, goal_data in enumerate(goals):
-                    goal = ProjectGoal(
-                        name=goal_data.get("name", f"Goal {i + 1}"),
-                        description=goal_data.get("description", ""),
-                        priority=goal_data.get("priority", i + 1),
-                        success_criteria=[],
-                    )
-
-                    # Add success criteria
-                    criteria = goal_data.get("success_criteria", [])
-                    for criterion in criteria:
-                        goal.success_criteria.append(SuccessCriterion(description=criterion))
-
-                    project_goals.append(goal)
+            # Create project goals with their success criteria
+            project_goals = [
+                ProjectGoal(
+                    name=goal_data.get("name", f"Goal {i + 1}"),
+                    description=goal_data.get("description", ""),
+                    priority=goal_data.get("priority", i + 1),
+                    success_criteria=[
+                        SuccessCriterion(description=criterion) for criterion in goal_data.get("success_criteria", [])
+                    ],
+                )
+                for i, goal_data in enumerate(goals or [])
+            ]
 
             # Create the project brief
             brief = ProjectBrief(
@@ -271,26 +385,20 @@ class ProjectManager:
             # Save the brief
             ProjectStorage.write_project_brief(project_id, brief)
 
-            # Log the creation
-            await ProjectStorage.log_project_event(
+            # Log the creation and notify linked conversations
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=LogEntryType.BRIEFING_CREATED.value,
                 message=f"Created project brief: {project_name}",
-            )
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="brief",
-                message=f"Project brief updated: {project_name}",
+                notification=f"Project brief updated: {project_name}",
             )
 
             return True, brief
 
-        except Exception as e:
-            logger.exception(f"Error creating project brief: {e}")
+        except Exception:
+            logger.exception("Error creating project brief")
             return False, None
 
     @staticmethod
@@ -309,29 +417,22 @@ class ProjectManager:
             True if update was successful, False otherwise
         """
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            if not project_id:
-                logger.error("Cannot update brief: no project associated with this conversation")
-                return False
-
-            # Get user information
-            current_user_id = await require_current_user(context, "update brief")
-            if not current_user_id:
+            # Get project ID, user information and the existing brief
+            project_id, current_user_id, brief = await ProjectManager._load_context(
+                context, "update brief", ProjectStorage.read_project_brief
+            )
+            if not project_id or not current_user_id:
                 return False
 
-            # Load existing brief
-            brief = ProjectStorage.read_project_brief(project_id)
             if not brief:
-                logger.error(f"Cannot update brief: no brief found for project {project_id}")
+                logger.error("Cannot update brief: no brief found for project %s", project_id)
                 return False
 
             # Apply updates, skipping immutable fields
             any_fields_updated = False
-            immutable_fields = ["created_by", "conversation_id", "created_at", "version"]
 
             for field, value in updates.items():
-                if hasattr(brief, field) and field not in immutable_fields:
+                if field in BRIEF_MUTABLE_FIELDS:
                     setattr(brief, field, value)
                     any_fields_updated = True
 
@@ -347,26 +448,20 @@ class ProjectManager:
             # Save the updated brief
             ProjectStorage.write_project_brief(project_id, brief)
 
-            # Log the update
-            await ProjectStorage.log_project_event(
+            # Log the update and notify linked conversations
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=LogEntryType.BRIEFING_UPDATED.value,
                 message=f"Updated project brief: {brief.project_name}",
-            )
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="brief",
-                message=f"Project brief updated: {brief.project_name}",
+                notification=f"Project brief updated: {brief.project_name}",
             )
 
             return True
 
-        except Exception as e:
-            logger.exception(f"Error updating project brief: {e}")
+        except Exception:
+            logger.exception("Error updating project brief")
             return False
 
     @staticmethod
@@ -385,6 +480,7 @@ class ProjectManager:
         progress: Optional[int] = None,
         status_message: Optional[str] = None,
         next_actions: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
     ) -> Tuple[bool, Optional[ProjectDashboard]]:
         """
         Updates the project dashboard.
@@ -395,24 +491,25 @@ class ProjectManager:
             progress: Optional progress percentage (0-100)
             status_message: Optional status message
             next_actions: Optional list of next actions
+            project_id: Optional project ID, if the caller has already looked it up
 
         Returns:
             Tuple of (success, project_dashboard)
         """
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            if not project_id:
-                logger.error("Cannot update dashboard: no project associated with this conversation")
+            # Get project ID, user information and the existing dashboard
+            project_id, current_user_id, dashboard = await ProjectManager._load_context(
+                context, "update dashboard", ProjectStorage.read_project_dashboard, project_id
+            )
+            if not project_id or not current_user_id:
                 return False, None
 
-            # Get user information
-            current_user_id = await require_current_user(context, "update dashboard")
-            if not current_user_id:
-                return False, None
+            # Nothing to change on an existing dashboard, so skip the write, log entry and notifications
+            if dashboard and not state and progress is None and not status_message and not next_actions:
+                logger.info("No updates applied to dashboard")
+                return True, dashboard
 
-            # Get existing dashboard or create new
-            dashboard = ProjectStorage.read_project_dashboard(project_id)
+            # Create a new dashboard if none exists yet
             is_new = False
 
             if not dashboard:
@@ -429,13 +526,7 @@ class ProjectManager:
                 brief = ProjectStorage.read_project_brief(project_id)
                 if brief:
                     dashboard.goals = brief.goals
-
-                    # Calculate total criteria
-                    total_criteria = 0
-                    for goal in brief.goals:
-                        total_criteria += len(goal.success_criteria)
-
-                    dashboard.total_criteria = total_criteria
+                    dashboard.total_criteria = sum(len(goal.success_criteria) for goal in brief.goals)
 
                 is_new = True
 
@@ -460,11 +551,11 @@ class ProjectManager:
             # Save the dashboard
             ProjectStorage.write_project_dashboard(project_id, dashboard)
 
-            # Log the update
+            # Log the update and notify linked conversations
             event_type = LogEntryType.STATUS_CHANGED
             message = "Created project dashboard" if is_new else "Updated project dashboard"
 
-            await ProjectStorage.log_project_event(
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=event_type.value,
@@ -473,20 +564,14 @@ class ProjectManager:
                     "state": dashboard.state.value if dashboard.state else None,
                     "progress": dashboard.progress_percentage,
                 },
-            )
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="dashboard",
-                message=f"Project dashboard updated: {dashboard.state.value if dashboard.state else 'Unknown'}",
+                notification=f"Project dashboard updated: {dashboard.state.value if dashboard.state else 'Unknown'}",
             )
 
             return True, dashboard
 
-        except Exception as e:
-            logger.exception(f"Error updating project dashboard: {e}")
+        except Exception:
+            logger.exception("Error updating project dashboard")
             return False, None
 
     @staticmethod
@@ -520,15 +605,9 @@ class ProjectManager:
             Tuple of (success, information_request)
         """
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            if not project_id:
-                logger.error("Cannot create information request: no project associated with this conversation")
-                return False, None
-
-            # Get user information
-            current_user_id = await require_current_user(context, "create information request")
-            if not current_user_id:
+            # Get project ID and user information
+            project_id, current_user_id, _ = await ProjectManager._load_context(context, "create information request")
+            if not project_id or not current_user_id:
                 return False, None
 
             # Create the information request
@@ -545,41 +624,31 @@ class ProjectManager:
             # Save the request
             ProjectStorage.write_information_request(project_id, information_request)
 
-            # Log the creation
-            await ProjectStorage.log_project_event(
+            # Update project dashboard to add this request as a blocker if high priority
+            if priority in BLOCKING_PRIORITIES and information_request.request_id:
+                ProjectStorage.update_dashboard_active_requests(
+                    project_id,
+                    current_user_id,
+                    add=[information_request.request_id],
+                    timestamp=information_request.created_at,
+                )
+
+            # Log the creation and notify linked conversations
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=LogEntryType.REQUEST_CREATED.value,
                 message=f"Created information request: {title}",
                 related_entity_id=information_request.request_id,
                 metadata={"priority": priority.value, "request_id": information_request.request_id},
-            )
-
-            # Update project dashboard to add this request as a blocker if high priority
-            if priority in [RequestPriority.HIGH, RequestPriority.CRITICAL]:
-                dashboard = ProjectStorage.read_project_dashboard(project_id)
-                if dashboard and information_request.request_id:
-                    dashboard.active_requests.append(information_request.request_id)
-                    dashboard.updated_at = datetime.utcnow()
-                    dashboard.updated_by = current_user_id
-                    dashboard.version += 1
-                    ProjectStorage.write_project_dashboard(project_id, dashboard)
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="information_request",
-                message=f"New information request: {title} (Priority: {priority.value})",
+                notification=f"New information request: {title} (Priority: {priority.value})",
             )
 
-            # Update all project UI inspectors
-            await ProjectStorage.refresh_all_project_uis(context, project_id)
-
             return True, information_request
 
-        except Exception as e:
-            logger.exception(f"Error creating information request: {e}")
+        except Exception:
+            logger.exception("Error creating information request")
             return False, None
 
     @staticmethod
@@ -600,34 +669,30 @@ class ProjectManager:
             Tuple of (success, information_request)
         """
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            if not project_id:
-                logger.error("Cannot update information request: no project associated with this conversation")
-                return False, None
-
-            # Get user information
-            current_user_id = await require_current_user(context, "update information request")
-            if not current_user_id:
+            # Get project ID, user information and the information request
+            project_id, current_user_id, information_request = await ProjectManager._load_context(
+                context,
+                "update information request",
+                lambda project_id: ProjectStorage.read_information_request(project_id, request_id),
+            )
+            if not project_id or not current_user_id:
                 return False, None
 
-            # Get the information request
-            information_request = ProjectStorage.read_information_request(project_id, request_id)
             if not information_request:
-                logger.error(f"Information request {request_id} not found")
+                logger.error("Information request %s not found", request_id)
                 return False, None
 
             # Apply updates, skipping protected fields
             updated = False
-            protected_fields = ["request_id", "created_by", "created_at", "conversation_id", "version"]
+            now = datetime.utcnow()
 
             for field, value in updates.items():
-                if hasattr(information_request, field) and field not in protected_fields:
+                if field in REQUEST_MUTABLE_FIELDS:
                     # Special handling for status changes
                     if field == "status" and information_request.status != value:
                         # Add an update to the history
                         information_request.updates.append({
-                            "timestamp": datetime.utcnow().isoformat(),
+                            "timestamp": now.isoformat(),
                             "user_id": current_user_id,
                             "message": f"Status changed from {information_request.status.value} to {value.value}",
                             "status": value.value,
@@ -637,38 +702,32 @@ class ProjectManager:
                     updated = True
 
             if not updated:
-                logger.info(f"No updates applied to information request {request_id}")
+                logger.info("No updates applied to information request %s", request_id)
                 return True, information_request
 
             # Update metadata
-            information_request.updated_at = datetime.utcnow()
+            information_request.updated_at = now
             information_request.updated_by = current_user_id
             information_request.version += 1
 
             # Save the updated request
             ProjectStorage.write_information_request(project_id, information_request)
 
-            # Log the update
-            await ProjectStorage.log_project_event(
+            # Log the update and notify linked conversations
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=LogEntryType.REQUEST_UPDATED.value,
                 message=f"Updated information request: {information_request.title}",
                 related_entity_id=information_request.request_id,
-            )
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="information_request_updated",
-                message=f"Information request updated: {information_request.title}",
+                notification=f"Information request updated: {information_request.title}",
             )
 
             return True, information_request
 
-        except Exception as e:
-            logger.exception(f"Error updating information request: {e}")
+        except Exception:
+            logger.exception("Error updating information request")
             return False, None
 
     @staticmethod
@@ -689,122 +748,105 @@ class ProjectManager:
             Tuple of (success, information_request)
         """
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            if not project_id:
-                logger.error("Cannot resolve information request: no project associated with this conversation")
-                return False, None
-
-            # Get user information
-            current_user_id = await require_current_user(context, "resolve information request")
-            if not current_user_id:
+            # Get project ID, user information and the information request
+            project_id, current_user_id, information_request = await ProjectManager._load_context(
+                context,
+                "resolve information request",
+                lambda project_id: ProjectStorage.read_information_request(project_id, request_id),
+            )
+            if not project_id or not current_user_id:
                 return False, None
 
-            # Get the information request
-            information_request = ProjectStorage.read_information_request(project_id, request_id)
+            # Request files are named by request ID, so the direct read is authoritative
             if not information_request:
-                # Try to find it in all requests
-                all_requests = ProjectStorage.get_all_information_requests(project_id)
-                for request in all_requests:
-                    if request.request_id == request_id:
-                        information_request = request
-                        break
-
-                if not information_request:
-                    logger.error(f"Information request {request_id} not found")
-                    return False, None
+                logger.error("Information request %s not found", request_id)
+                return False, None
 
             # Check if already resolved
             if information_request.status == RequestStatus.RESOLVED:
-                logger.info(f"Information request {request_id} is already resolved")
+                logger.info("Information request %s is already resolved", request_id)
                 return True, information_request
 
-            # Update the request
+            # Update the request, using a single timestamp for the whole resolution
+            now = datetime.utcnow()
             information_request.status = RequestStatus.RESOLVED
             information_request.resolution = resolution
-            information_request.resolved_at = datetime.utcnow()
+            information_request.resolved_at = now
             information_request.resolved_by = current_user_id
 
             # Add to history
             information_request.updates.append({
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
                 "user_id": current_user_id,
                 "message": f"Request resolved: {resolution}",
                 "status": RequestStatus.RESOLVED.value,
             })
 
             # Update metadata
-            information_request.updated_at = datetime.utcnow()
+            information_request.updated_at = now
             information_request.updated_by = current_user_id
             information_request.version += 1
 
             # Save the updated request
             ProjectStorage.write_information_request(project_id, information_request)
 
-            # Log the resolution
-            await ProjectStorage.log_project_event(
-                context=context,
-                project_id=project_id,
-                entry_type=LogEntryType.REQUEST_RESOLVED.value,
-                message=f"Resolved information request: {information_request.title}",
-                related_entity_id=information_request.request_id,
-                metadata={
-                    "resolution": resolution,
-                    "request_title": information_request.title,
-                    "request_priority": information_request.priority.value
-                    if hasattr(information_request.priority, "value")
-                    else information_request.priority,
-                },
-            )
-
             # Update project dashboard if this was a blocker
-            dashboard = ProjectStorage.read_project_dashboard(project_id)
-            if dashboard and information_request.request_id in dashboard.active_requests:
-                dashboard.active_requests.remove(information_request.request_id)
-                dashboard.updated_at = datetime.utcnow()
-                dashboard.updated_by = current_user_id
-                dashboard.version += 1
-                ProjectStorage.write_project_dashboard(project_id, dashboard)
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
-                update_type="information_request_resolved",
-                message=f"Information request resolved: {information_request.title}",
-            )
-
-            # Send direct notification to requestor's conversation
-            if information_request.conversation_id != str(context.id):
-                from semantic_workbench_api_model.workbench_model import MessageType, NewConversationMessage
-
-                from .conversation_clients import ConversationClientManager
-
-                try:
-                    # Get client for requestor's conversation
-                    client = ConversationClientManager.get_conversation_client(
-                        context, information_request.conversation_id
-                    )
+            if information_request.request_id:
+                ProjectStorage.update_dashboard_active_requests(
+                    project_id, current_user_id, remove=[information_request.request_id], timestamp=now
+                )
 
-                    # Send notification message
-                    await client.send_messages(
-                        NewConversationMessage(
-                            content=f"Coordinator has resolved your request '{information_request.title}': {resolution}",
-                            message_type=MessageType.notice,
-                        )
+            # Log the resolution, notify linked conversations and send a direct notification
+            # to the requestor's conversation, all concurrently
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    ProjectStorage.log_and_notify(
+                        context=context,
+                        project_id=project_id,
+                        entry_type=LogEntryType.REQUEST_RESOLVED.value,
+                        message=f"Resolved information request: {information_request.title}",
+                        related_entity_id=information_request.request_id,
+                        metadata={
+                            "resolution": resolution,
+                            "request_title": information_request.title,
+                            "request_priority": information_request.priority.value
+                            if hasattr(information_request.priority, "value")
+                            else information_request.priority,
+                        },
+                        update_type="information_request_resolved",
+                        notification=f"Information request resolved: {information_request.title}",
                     )
-                except Exception as e:
-                    logger.warning(f"Could not send notification to requestor: {e}")
-
-            # Update all project UI inspectors
-            await ProjectStorage.refresh_all_project_uis(context, project_id)
+                )
+                if information_request.conversation_id != str(context.id):
+                    tg.create_task(ProjectManager._notify_requestor(context, information_request, resolution))
 
             return True, information_request
 
-        except Exception as e:
-            logger.exception(f"Error resolving information request: {e}")
+        except Exception:
+            logger.exception("Error resolving information request")
             return False, None
 
+    @staticmethod
+    async def _notify_requestor(
+        context: ConversationContext,
+        information_request: InformationRequest,
+        resolution: str,
+    ) -> None:
+        """Sends a notice about a resolved request to the conversation that created it."""
+        try:
+            # Get client for requestor's conversation
+            client = ConversationClientManager.get_conversation_client(context, information_request.conversation_id)
+
+            # Send notification message
+            await client.send_messages(
+                NewConversationMessage(
+                    content=f"Coordinator has resolved your request '{information_request.title}': {resolution}",
+                    message_type=MessageType.notice,
+                )
+            )
+        except Exception as e:
+            logger.warning("Could not send notification to requestor: %s", e)
+
     @staticmethod
     async def get_project_log(context: ConversationContext) -> Optional[ProjectLog]:
         """Gets the project log for the current conversation's project."""
@@ -812,6 +854,8 @@ class ProjectManager:
         if not project_id:
             return None
 
+        # Include any entries still being written in the background
+        await ProjectLogWriter.flush()
         return ProjectStorage.read_project_log(project_id)
 
     @staticmethod
@@ -821,10 +865,13 @@ class ProjectManager:
         message: str,
         related_entity_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[bool, Optional[ProjectLog]]:
+    ) -> Tuple[bool, Optional[LogEntry]]:
         """
         Adds an entry to the project log.
 
+        The entry is written to the log in the background, batched with any other pending entries
+        for the project. Use get_project_log to read the log including all pending entries.
+
         Args:
             context: Current conversation context
             entry_type: Type of log entry
@@ -833,7 +880,7 @@ class ProjectManager:
             metadata: Optional additional metadata
 
         Returns:
-            Tuple of (success, project_log)
+            Tuple of (success, log_entry)
         """
         try:
             # Get project ID
@@ -861,48 +908,29 @@ class ProjectManager:
                 metadata=metadata or {},
             )
 
-            # Get existing log or create new one
-            project_log = ProjectStorage.read_project_log(project_id)
-            if not project_log:
-                project_log = ProjectLog(
-                    created_by=current_user_id,
-                    updated_by=current_user_id,
-                    conversation_id=str(context.id),
-                    entries=[],
-                )
-
-            # Add the entry
-            project_log.entries.append(entry)
-
-            # Update metadata
-            project_log.updated_at = datetime.utcnow()
-            project_log.updated_by = current_user_id
-            project_log.version += 1
-
-            # Save the log
-            ProjectStorage.write_project_log(project_id, project_log)
+            # Queue the entry to be written with any other pending entries
+            ProjectLogWriter.append(context, project_id, entry)
 
             # Notify linked conversations for significant events
-            significant_types = [
-                LogEntryType.PROJECT_STARTED,
-                LogEntryType.PROJECT_COMPLETED,
-                LogEntryType.PROJECT_ABORTED,
-                LogEntryType.GOAL_COMPLETED,
-                LogEntryType.MILESTONE_PASSED,
-            ]
-
-            if entry_type in significant_types:
+            if entry_type in AWAITED_LOG_ENTRY_TYPES:
                 await ProjectNotifier.notify_project_update(
                     context=context,
                     project_id=project_id,
                     update_type="project_log",
                     message=f"Project update: {message}",
                 )
+            elif entry_type in SIGNIFICANT_LOG_ENTRY_TYPES:
+                ProjectNotifier.notify_project_update_in_background(
+                    context=context,
+                    project_id=project_id,
+                    update_type="project_log",
+                    message=f"Project update: {message}",
+                )
 
-            return True, project_log
+            return True, entry
 
-        except Exception as e:
-            logger.exception(f"Error adding log entry: {e}")
+        except Exception:
+            logger.exception("Error adding log entry")
             return False, None
 
     @staticmethod
@@ -919,6 +947,7 @@ class ProjectManager:
         context: ConversationContext,
         content: str,
         is_auto_generated: bool = True,
+        project_id: Optional[str] = None,
     ) -> Tuple[bool, Optional[ProjectWhiteboard]]:
         """
         Updates the project whiteboard content.
@@ -927,36 +956,36 @@ class ProjectManager:
             context: Current conversation context
             content: Whiteboard content in markdown format
             is_auto_generated: Whether the content was automatically generated
+            project_id: Optional project ID, if the caller has already looked it up
 
         Returns:
             Tuple of (success, project_kb)
         """
-        logger.error(
-            "DEBUG: update_whiteboard called with content length: %d, auto_generated: %s",
-            len(content),
-            is_auto_generated,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "update_whiteboard called with content length: %d, auto_generated: %s",
+                len(content),
+                is_auto_generated,
+            )
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            logger.error("DEBUG: update_whiteboard found project ID: %s", project_id)
-            if not project_id:
-                logger.error("Cannot update whiteboard: no project associated with this conversation")
-                return False, None
-
-            # Get user information
-            current_user_id = await require_current_user(context, "update whiteboard")
-            if not current_user_id:
+            # Get project ID, user information and the existing whiteboard
+            project_id, current_user_id, whiteboard = await ProjectManager._load_context(
+                context, "update whiteboard", ProjectStorage.read_project_whiteboard, project_id
+            )
+            logger.debug("update_whiteboard found project ID: %s", project_id)
+            if not project_id or not current_user_id:
                 return False, None
 
-            # Get existing whiteboard or create new one
-            whiteboard = ProjectStorage.read_project_whiteboard(project_id)
+            # Create a new whiteboard if none exists yet
             is_new = False
+            now = datetime.utcnow()
 
             if not whiteboard:
                 whiteboard = ProjectWhiteboard(
                     created_by=current_user_id,
                     updated_by=current_user_id,
+                    created_at=now,
+                    updated_at=now,
                     conversation_id=str(context.id),
                     content="",
                 )
@@ -967,43 +996,39 @@ class ProjectManager:
             whiteboard.is_auto_generated = is_auto_generated
 
             # Update metadata
-            whiteboard.updated_at = datetime.utcnow()
+            whiteboard.updated_at = now
             whiteboard.updated_by = current_user_id
             whiteboard.version += 1
 
             # Save the whiteboard
             ProjectStorage.write_project_whiteboard(project_id, whiteboard)
 
-            # Log the update
+            # Log the update and notify linked conversations
             event_type = LogEntryType.KB_UPDATE
             update_type = "auto-generated" if is_auto_generated else "manual"
             message = f"{'Created' if is_new else 'Updated'} project whiteboard ({update_type})"
 
-            await ProjectStorage.log_project_event(
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=event_type.value,
                 message=message,
-            )
-
-            # Notify linked conversations
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="project_whiteboard",
-                message="Project whiteboard updated",
+                notification="Project whiteboard updated",
+                background=True,
             )
 
             return True, whiteboard
 
-        except Exception as e:
-            logger.exception(f"Error updating whiteboard: {e}")
+        except Exception:
+            logger.exception("Error updating whiteboard")
             return False, None
 
     @staticmethod
     async def auto_update_whiteboard(
         context: ConversationContext,
         chat_history: List[Any],
+        project_id: Optional[str] = None,
     ) -> Tuple[bool, Optional[ProjectWhiteboard]]:
         """
         Automatically updates the whiteboard by analyzing chat history.
@@ -1016,15 +1041,16 @@ class ProjectManager:
         Args:
             context: Current conversation context
             chat_history: Recent chat messages to analyze
+            project_id: Optional project ID, if the caller has already looked it up
 
         Returns:
             Tuple of (success, project_kb)
         """
-        logger.error("DEBUG: auto_update_whiteboard called with conversation ID: %s", context.id)
+        logger.debug("auto_update_whiteboard called with conversation ID: %s", context.id)
         try:
-            # Get project ID
-            project_id = await ProjectManager.get_project_id(context)
-            logger.error("DEBUG: auto_update_whiteboard found project ID: %s", project_id)
+            # Get project ID, unless the caller already has it
+            project_id = project_id or await ProjectManager.get_project_id(context)
+            logger.debug("auto_update_whiteboard found project ID: %s", project_id)
             if not project_id:
                 logger.error("Cannot auto-update whiteboard: no project associated with this conversation")
                 return False, None
@@ -1039,68 +1065,71 @@ class ProjectManager:
                 logger.info("No chat history to analyze for whiteboard update")
                 return False, None
 
-            # Import necessary model types
-            from semantic_workbench_api_model.workbench_model import ParticipantRole
-
             # Format the chat history for the prompt
-            chat_history_text = ""
-            for msg in chat_history:
-                sender_type = (
-                    "User" if msg.sender and msg.sender.participant_role == ParticipantRole.user else "Assistant"
-                )
-                chat_history_text += f"{sender_type}: {msg.content}\n\n"
+            chat_history_text = "".join(
+                f"{'User' if msg.sender and msg.sender.participant_role == ParticipantRole.user else 'Assistant'}: "
+                f"{msg.content}\n\n"
+                for msg in chat_history
+            )
+
+            # The same history produces the same whiteboard, so skip the LLM call if it hasn't changed
+            input_hash = hashlib.blake2b(chat_history_text.encode(), digest_size=16).digest()
+            if _whiteboard_input_hashes.get(project_id) == input_hash:
+                whiteboard = ProjectStorage.read_project_whiteboard(project_id)
+                if whiteboard:
+                    logger.info("Chat history unchanged since the last whiteboard update, skipping")
+                    return True, whiteboard
 
-            # Get config for the LLM call
+            # Get config for the LLM call (imported here because chat imports this module)
             from .chat import assistant_config
 
             config = await assistant_config.get(context.assistant)
 
-            # Load the whiteboard prompt from text includes
-            from .utils import load_text_include
-            
-            template_id = context.assistant._template_id
-            
-            # Use the appropriate prompt based on the template
-            if template_id == "context_transfer":
-                whiteboard_prompt_template = load_text_include("context_transfer_whiteboard_prompt.txt")
-            else:
-                whiteboard_prompt_template = load_text_include("whiteboard_auto_update_prompt.txt")
+            # Use the whiteboard prompt for the assistant's template
+            whiteboard_prompt_template = _get_whiteboard_prompt_template(context.assistant._template_id)
             
             # Construct the whiteboard prompt with the chat history
-            whiteboard_prompt = f"""
-            {whiteboard_prompt_template}
-            
-            <CHAT_HISTORY>
-            {chat_history_text}
-            </CHAT_HISTORY>
-            """
-
-            # Import necessary modules for the LLM call
-            import openai_client
-
-            # Create a completion with the whiteboard prompt
-            async with openai_client.create_client(config.service_config, api_version="2024-06-01") as client:
-                completion = await client.chat.completions.create(
-                    model=config.request_config.openai_model,
-                    messages=[{"role": "user", "content": whiteboard_prompt}],
-                    max_tokens=2500,  # Limiting to 2500 tokens to keep whiteboard content manageable
-                )
-
-                # Extract the content from the completion
-                content = completion.choices[0].message.content or ""
-
-                # Extract just the whiteboard content
-                import re
+            whiteboard_prompt = WHITEBOARD_PROMPT_FORMAT.format(
+                template=whiteboard_prompt_template, chat_history=chat_history_text
+            )
 
-                whiteboard_content = ""
+            # Create a completion with the whiteboard prompt, using a client shared across updates
+            client = _get_whiteboard_client(config.service_config)
+            stream = await client.chat.completions.create(
+                model=config.request_config.openai_model,
+                messages=[{"role": "user", "content": whiteboard_prompt}],
+                max_tokens=2500,  # Limiting to 2500 tokens to keep whiteboard content manageable
+                stream=True,
+            )
 
-                # Look for content between <WHITEBOARD> tags
-                match = re.search(r"<WHITEBOARD>(.*?)</WHITEBOARD>", content, re.DOTALL)
-                if match:
-                    whiteboard_content = match.group(1).strip()
-                else:
-                    # If no tags, use the whole content
-                    whiteboard_content = content.strip()
+            # Collect the content, stopping as soon as the whiteboard is closed since anything after
+            # the closing tag is discarded anyway
+            parts: List[str] = []
+            tail = ""
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+
+                parts.append(delta)
+                window = tail + delta
+                if WHITEBOARD_CLOSE_TAG in window:
+                    await stream.close()
+                    break
+                tail = window[-len(WHITEBOARD_CLOSE_TAG) :]
+
+            content = "".join(parts)
+
+            # Extract just the whiteboard content
+            whiteboard_content = ""
+
+            # Look for content between <WHITEBOARD> tags
+            match = WHITEBOARD_CONTENT_PATTERN.search(content)
+            if match:
+                whiteboard_content = match.group(1).strip()
+            else:
+                # If no tags, use the whole content
+                whiteboard_content = content.strip()
 
             # Only update if we have content
             if not whiteboard_content:
@@ -1108,14 +1137,19 @@ class ProjectManager:
                 return False, None
 
             # Update the whiteboard with the extracted content
-            return await ProjectManager.update_whiteboard(
+            success, whiteboard = await ProjectManager.update_whiteboard(
                 context=context,
                 content=whiteboard_content,
                 is_auto_generated=True,
+                project_id=project_id,
             )
+            if success:
+                _whiteboard_input_hashes[project_id] = input_hash
 
-        except Exception as e:
-            logger.exception(f"Error auto-updating whiteboard: {e}")
+            return success, whiteboard
+
+        except Exception:
+            logger.exception("Error auto-updating whiteboard")
             return False, None
 
     @staticmethod
@@ -1153,29 +1187,24 @@ class ProjectManager:
                 state=ProjectState.COMPLETED.value,
                 progress=100,
                 status_message=status_message,
+                project_id=project_id,
             )
 
             if not success or not dashboard:
                 return False, None
 
-            # Add completion entry to the log
-            await ProjectStorage.log_project_event(
+            # Add completion entry to the log and notify linked conversations with emphasis
+            await ProjectStorage.log_and_notify(
                 context=context,
                 project_id=project_id,
                 entry_type=LogEntryType.PROJECT_COMPLETED.value,
                 message=f"Project completed: {status_message}",
-            )
-
-            # Notify linked conversations with emphasis
-            await ProjectNotifier.notify_project_update(
-                context=context,
-                project_id=project_id,
                 update_type="project_completed",
-                message=f"🎉 PROJECT COMPLETED: {status_message}",
+                notification=f"🎉 PROJECT COMPLETED: {status_message}",
             )
 
             return True, dashboard
 
-        except Exception as e:
-            logger.exception(f"Error completing project: {e}")
+        except Exception:
+            logger.exception("Error completing project")
             return False, None
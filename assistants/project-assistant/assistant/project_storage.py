@@ -4,11 +4,13 @@ Project storage management module.
 Provides direct access to project data with a clean, simple storage approach.
 """
 
+import asyncio
 import logging
 import pathlib
+from collections import OrderedDict, deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Deque, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel, Field
 from semantic_workbench_assistant import settings
@@ -24,11 +26,66 @@ from .project_data import (
     ProjectDashboard,
     ProjectLog,
     ProjectWhiteboard,
+    RequestStatus,
 )
 from .utils import get_current_user
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Serialized entities keyed by file path, along with the file's (mtime, size) when they were read or written
+MODEL_CACHE_SIZE = 256
+_model_cache: OrderedDict[pathlib.Path, Tuple[Tuple[int, int], str]] = OrderedDict()
+
+
+def _cache_model_json(path: pathlib.Path, data_json: str) -> None:
+    """Caches a file's JSON content against its current modification time and size."""
+    stat = path.stat()
+    _model_cache[path] = ((stat.st_mtime_ns, stat.st_size), data_json)
+    _model_cache.move_to_end(path)
+    if len(_model_cache) > MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+
+
+def read_model_cached(path: pathlib.Path, cls: Type[ModelT]) -> Optional[ModelT]:
+    """
+    Reads a model from disk, reusing the file's cached content if it hasn't changed since it was last read.
+
+    The file's modification time and size are checked on every call, so writes made by other
+    conversations or processes are picked up. Each call parses a new model instance, so callers
+    are free to modify it.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _model_cache.pop(path, None)
+        return None
+
+    cached = _model_cache.get(path)
+    if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        _model_cache.move_to_end(path)
+        return cls.model_validate_json(cached[1])
+
+    try:
+        data_json = path.read_text(encoding="utf-8")
+    except (FileNotFoundError, ValueError):
+        _model_cache.pop(path, None)
+        return None
+
+    model = cls.model_validate_json(data_json)
+    _cache_model_json(path, data_json)
+    return model
+
+
+def write_model_cached(path: pathlib.Path, model: BaseModel) -> None:
+    """Writes a model to disk and caches its JSON so the next read doesn't touch the file contents."""
+    _model_cache.pop(path, None)
+    data_json = model.model_dump_json()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data_json, encoding="utf-8")
+    _cache_model_json(path, data_json)
+
 
 class ProjectRole(str, Enum):
     """Role of a conversation in a project."""
@@ -77,6 +134,9 @@ class ProjectStorageManager:
         COORDINATOR_CONVERSATION: "coordinator_conversation.json",
     }
 
+    # Project log entries are appended to this file, one JSON entry per line, next to the log itself
+    PROJECT_LOG_ENTRIES_FILE = "log_entries.jsonl"
+
     @staticmethod
     def get_projects_root() -> pathlib.Path:
         """Gets the root path for all projects."""
@@ -143,6 +203,12 @@ class ProjectStorageManager:
         entity_dir = ProjectStorageManager.get_entity_dir(project_id, ProjectStorageManager.PROJECT_LOG)
         return entity_dir / ProjectStorageManager.PREDEFINED_ENTITIES[ProjectStorageManager.PROJECT_LOG]
 
+    @staticmethod
+    def get_project_log_entries_path(project_id: str) -> pathlib.Path:
+        """Gets the path to the append-only file of project log entries."""
+        entity_dir = ProjectStorageManager.get_entity_dir(project_id, ProjectStorageManager.PROJECT_LOG)
+        return entity_dir / ProjectStorageManager.PROJECT_LOG_ENTRIES_FILE
+
     @staticmethod
     def get_project_dashboard_path(project_id: str) -> pathlib.Path:
         """Gets the path to the project dashboard file."""
@@ -200,41 +266,112 @@ class ProjectStorage:
     def read_project_brief(project_id: str) -> Optional[ProjectBrief]:
         """Reads the project brief."""
         path = ProjectStorageManager.get_brief_path(project_id)
-        return read_model(path, ProjectBrief)
+        return read_model_cached(path, ProjectBrief)
 
     @staticmethod
     def write_project_brief(project_id: str, brief: ProjectBrief) -> pathlib.Path:
         """Writes the project brief."""
         path = ProjectStorageManager.get_brief_path(project_id)
-        write_model(path, brief)
+        write_model_cached(path, brief)
         return path
 
     @staticmethod
     def read_project_log(project_id: str) -> Optional[ProjectLog]:
-        """Reads the project log."""
+        """
+        Reads the project log.
+
+        The log file holds the log's metadata, while its entries are stored one per line in a separate
+        append-only file. Logs written before the entries were split out keep their entries inline, and
+        those come first.
+        """
         path = ProjectStorageManager.get_project_log_path(project_id)
-        return read_model(path, ProjectLog)
+        log = read_model(path, ProjectLog)
+        if not log:
+            return None
+
+        entries_path = ProjectStorageManager.get_project_log_entries_path(project_id)
+        if entries_path.exists():
+            for line in entries_path.read_text(encoding="utf-8").splitlines():
+                if not line:
+                    continue
+                try:
+                    log.entries.append(LogEntry.model_validate_json(line))
+                except ValueError as e:
+                    # A write interrupted part way through a line leaves it truncated
+                    logger.warning(f"Skipping unreadable log entry for project {project_id}: {e}")
+
+        return log
 
     @staticmethod
     def write_project_log(project_id: str, log: ProjectLog) -> pathlib.Path:
-        """Writes the project log."""
+        """Writes the project log, replacing all of its entries."""
+        entries_path = ProjectStorageManager.get_project_log_entries_path(project_id)
+        entries_path.parent.mkdir(parents=True, exist_ok=True)
+        entries_path.write_text(
+            "".join(entry.model_dump_json() + "\n" for entry in log.entries),
+            encoding="utf-8",
+        )
+
         path = ProjectStorageManager.get_project_log_path(project_id)
-        write_model(path, log)
+        write_model(path, log.model_copy(update={"entries": []}))
         return path
 
     @staticmethod
     def read_project_dashboard(project_id: str) -> Optional[ProjectDashboard]:
         """Reads the project dashboard."""
         path = ProjectStorageManager.get_project_dashboard_path(project_id)
-        return read_model(path, ProjectDashboard)
+        return read_model_cached(path, ProjectDashboard)
 
     @staticmethod
     def write_project_dashboard(project_id: str, dashboard: ProjectDashboard) -> pathlib.Path:
         """Writes the project dashboard."""
         path = ProjectStorageManager.get_project_dashboard_path(project_id)
-        write_model(path, dashboard)
+        write_model_cached(path, dashboard)
         return path
 
+    @staticmethod
+    def update_dashboard_active_requests(
+        project_id: str,
+        user_id: str,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Adds and removes request IDs in the dashboard's active (blocking) requests.
+
+        The dashboard is only written, and its version bumped, if the list actually changes.
+
+        Args:
+            project_id: The ID of the project
+            user_id: The ID of the user making the change
+            add: Request IDs to add, if not already present
+            remove: Request IDs to remove, if present
+            timestamp: The update time (defaults to now)
+
+        Returns:
+            True if the dashboard was updated, False if it doesn't exist or nothing changed
+        """
+        dashboard = ProjectStorage.read_project_dashboard(project_id)
+        if not dashboard:
+            return False
+
+        removed = set(remove or [])
+        active_requests = [request_id for request_id in dashboard.active_requests if request_id not in removed]
+        for request_id in add or []:
+            if request_id not in active_requests:
+                active_requests.append(request_id)
+
+        if active_requests == dashboard.active_requests:
+            return False
+
+        dashboard.active_requests = active_requests
+        dashboard.updated_at = timestamp or datetime.utcnow()
+        dashboard.updated_by = user_id
+        dashboard.version += 1
+        ProjectStorage.write_project_dashboard(project_id, dashboard)
+        return True
+
     @staticmethod
     def read_project_whiteboard(project_id: str) -> Optional[ProjectWhiteboard]:
         """Reads the project whiteboard."""
@@ -274,22 +411,35 @@ class ProjectStorage:
             is_assistant: Whether the message is from the assistant
             timestamp: The timestamp of the message (defaults to now)
         """
+        ProjectStorage.append_coordinator_messages(
+            project_id,
+            [
+                CoordinatorConversationMessage(
+                    message_id=message_id,
+                    content=content,
+                    sender_name=sender_name,
+                    timestamp=timestamp or datetime.utcnow(),
+                    is_assistant=is_assistant,
+                )
+            ],
+        )
+
+    @staticmethod
+    def append_coordinator_messages(project_id: str, messages: List[CoordinatorConversationMessage]) -> None:
+        """
+        Appends several messages to the Coordinator conversation storage with a single read and write.
+
+        Args:
+            project_id: The ID of the project
+            messages: The messages to append, oldest first
+        """
         # Get existing conversation or create new one
         conversation = ProjectStorage.read_coordinator_conversation(project_id)
         if not conversation:
             conversation = CoordinatorConversationStorage(project_id=project_id)
 
-        # Create new message
-        new_message = CoordinatorConversationMessage(
-            message_id=message_id,
-            content=content,
-            sender_name=sender_name,
-            timestamp=timestamp or datetime.utcnow(),
-            is_assistant=is_assistant,
-        )
-
         # Add to conversation (only keep most recent 50 messages)
-        conversation.messages.append(new_message)
+        conversation.messages.extend(messages)
         if len(conversation.messages) > 50:
             conversation.messages = conversation.messages[-50:]
 
@@ -309,7 +459,7 @@ class ProjectStorage:
     def read_information_request(project_id: str, request_id: str) -> Optional[InformationRequest]:
         """Reads an information request."""
         path = ProjectStorageManager.get_information_request_path(project_id, request_id)
-        return read_model(path, InformationRequest)
+        return read_model_cached(path, InformationRequest)
 
     @staticmethod
     def write_information_request(project_id: str, request: InformationRequest) -> pathlib.Path:
@@ -319,7 +469,7 @@ class ProjectStorage:
             raise ValueError("Information request must have a request_id")
 
         path = ProjectStorageManager.get_information_request_path(project_id, request.request_id)
-        write_model(path, request)
+        write_model_cached(path, request)
         return path
 
     @staticmethod
@@ -332,7 +482,7 @@ class ProjectStorage:
             return requests
 
         for file_path in dir_path.glob("*.json"):
-            request = read_model(file_path, InformationRequest)
+            request = read_model_cached(file_path, InformationRequest)
             if request:
                 requests.append(request)
 
@@ -340,6 +490,51 @@ class ProjectStorage:
         requests.sort(key=lambda r: r.updated_at, reverse=True)
         return requests
 
+    @staticmethod
+    def query_information_requests(
+        project_id: str,
+        exclude_statuses: Optional[Set[RequestStatus]] = None,
+        conversation_id: Optional[str] = None,
+        exclude_conversation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[InformationRequest]:
+        """
+        Gets the information requests for a project that match the given filters.
+
+        Requests are filtered as they are read, so only the matching ones are collected and sorted.
+
+        Args:
+            project_id: The ID of the project
+            exclude_statuses: Statuses to leave out (e.g. resolved requests)
+            conversation_id: Only include requests from this conversation
+            exclude_conversation_id: Leave out requests from this conversation
+            limit: Maximum number of requests to return
+
+        Returns:
+            Matching requests sorted by updated_at timestamp, newest first
+        """
+        dir_path = ProjectStorageManager.get_information_requests_dir(project_id)
+        requests = []
+
+        if not dir_path.exists():
+            return requests
+
+        for file_path in dir_path.glob("*.json"):
+            request = read_model_cached(file_path, InformationRequest)
+            if not request:
+                continue
+            if exclude_statuses and request.status in exclude_statuses:
+                continue
+            if conversation_id is not None and request.conversation_id != conversation_id:
+                continue
+            if exclude_conversation_id is not None and request.conversation_id == exclude_conversation_id:
+                continue
+            requests.append(request)
+
+        # Sort by updated_at timestamp, newest first
+        requests.sort(key=lambda r: r.updated_at, reverse=True)
+        return requests[:limit] if limit is not None else requests
+
     @staticmethod
     async def refresh_current_ui(context: ConversationContext) -> None:
         """
@@ -440,6 +635,8 @@ class ProjectStorage:
         """
         Logs an event to the project log.
 
+        The entry is written by ProjectLogWriter, in order with any other pending entries for the project.
+
         Args:
             context: Current conversation context
             project_id: ID of the project
@@ -470,31 +667,394 @@ class ProjectStorage:
             metadata=metadata or {},
         )
 
-        # Get existing log or create a new one
-        log = ProjectStorage.read_project_log(project_id)
+        # Queue the entry behind any other pending entries for the project
+        ProjectLogWriter.append(context, project_id, entry)
+        return True
+
+    @staticmethod
+    def append_log_entries(project_id: str, entries: List[LogEntry], conversation_id: str) -> None:
+        """
+        Appends entries to the project log.
+
+        The entries are appended to the log's entries file and only the log's metadata is rewritten,
+        so the cost doesn't grow with the length of the log.
+
+        Args:
+            project_id: ID of the project
+            entries: The entries to append, oldest first
+            conversation_id: ID of the conversation to record if a new log is created
+        """
+        user_id = entries[-1].user_id
+        now = datetime.utcnow()
+
+        # Get the existing log's metadata or create a new log
+        path = ProjectStorageManager.get_project_log_path(project_id)
+        log = read_model(path, ProjectLog)
         if not log:
             # Create a new project log
             log = ProjectLog(
                 created_by=user_id,
                 updated_by=user_id,
-                conversation_id=str(context.id),
+                created_at=now,
+                updated_at=now,
+                conversation_id=conversation_id,
                 entries=[],
             )
 
-        # Add the entry and update metadata
-        log.entries.append(entry)
-        log.updated_at = datetime.utcnow()
+        # Update metadata
+        log.updated_at = now
         log.updated_by = user_id
         log.version += 1
 
-        # Save the updated log
-        ProjectStorage.write_project_log(project_id, log)
-        return True
+        # A log with inline entries predates the entries file, so move them all into it with a full write
+        if log.entries:
+            log.entries.extend(entries)
+            ProjectStorage.write_project_log(project_id, log)
+            return
+
+        entries_path = ProjectStorageManager.get_project_log_entries_path(project_id)
+        entries_path.parent.mkdir(parents=True, exist_ok=True)
+        with entries_path.open("a", encoding="utf-8") as f:
+            f.write("".join(entry.model_dump_json() + "\n" for entry in entries))
+
+        write_model(path, log)
+
+    @staticmethod
+    async def log_and_notify(
+        context: ConversationContext,
+        project_id: str,
+        entry_type: str,
+        message: str,
+        related_entity_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        update_type: str = "",
+        notification: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        background: bool = False,
+    ) -> None:
+        """
+        Logs an event to the project log and, if a notification is given, notifies all project conversations.
+
+        The log entry is queued with ProjectLogWriter and written in the background, so only the
+        notification fan-out is awaited, unless it is sent in the background too.
+
+        Args:
+            context: Current conversation context
+            project_id: ID of the project
+            entry_type: Type of log entry
+            message: Log message
+            related_entity_id: Optional ID of a related entity (e.g., information request)
+            metadata: Optional additional metadata for the log entry
+            update_type: Type of update for the notification (e.g., 'file_created')
+            notification: Optional notification message; no notification is sent if omitted
+            data: Optional additional data for the notification
+            background: Whether to send the notification without waiting for it
+        """
+        ProjectLogWriter.enqueue(
+            context=context,
+            project_id=project_id,
+            entry_type=entry_type,
+            message=message,
+            related_entity_id=related_entity_id,
+            metadata=metadata,
+        )
+
+        if not notification:
+            return
+
+        if background:
+            ProjectNotifier.notify_project_update_in_background(
+                context=context,
+                project_id=project_id,
+                update_type=update_type,
+                message=notification,
+                data=data,
+            )
+        else:
+            await ProjectNotifier.notify_project_update(
+                context=context,
+                project_id=project_id,
+                update_type=update_type,
+                message=notification,
+                data=data,
+            )
+
+
+class CoordinatorMessageBatcher:
+    """
+    Buffers Coordinator messages and appends them to storage in batches.
+
+    Messages for a project are written together once FLUSH_INTERVAL_SECONDS have passed since
+    the first one was queued, or as soon as MAX_BATCH_SIZE messages are waiting.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 0.5
+    MAX_BATCH_SIZE = 50
+
+    _pending: ClassVar[Dict[str, List[CoordinatorConversationMessage]]] = {}
+    _timers: ClassVar[Dict[str, asyncio.TimerHandle]] = {}
+
+    @staticmethod
+    def enqueue(
+        project_id: str,
+        message_id: str,
+        content: str,
+        sender_name: str,
+        is_assistant: bool = False,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Queues a message for the Coordinator conversation storage. Must be called from a running event loop.
+
+        Args:
+            project_id: The ID of the project
+            message_id: The ID of the message
+            content: The message content
+            sender_name: The name of the sender
+            is_assistant: Whether the message is from the assistant
+            timestamp: The timestamp of the message (defaults to now)
+        """
+        CoordinatorMessageBatcher.enqueue_messages(
+            project_id,
+            [
+                CoordinatorConversationMessage(
+                    message_id=message_id,
+                    content=content,
+                    sender_name=sender_name,
+                    timestamp=timestamp or datetime.utcnow(),
+                    is_assistant=is_assistant,
+                )
+            ],
+        )
+
+    @staticmethod
+    def enqueue_messages(project_id: str, messages: List[CoordinatorConversationMessage]) -> None:
+        """
+        Queues several messages for the Coordinator conversation storage at once. Must be called from a
+        running event loop.
+
+        Args:
+            project_id: The ID of the project
+            messages: The messages to queue, oldest first
+        """
+        pending = CoordinatorMessageBatcher._pending.setdefault(project_id, [])
+        pending.extend(messages)
+
+        if len(pending) >= CoordinatorMessageBatcher.MAX_BATCH_SIZE:
+            CoordinatorMessageBatcher.flush(project_id)
+        elif project_id not in CoordinatorMessageBatcher._timers:
+            CoordinatorMessageBatcher._timers[project_id] = asyncio.get_running_loop().call_later(
+                CoordinatorMessageBatcher.FLUSH_INTERVAL_SECONDS, CoordinatorMessageBatcher.flush, project_id
+            )
+
+    @staticmethod
+    def flush(project_id: str) -> None:
+        """Writes any queued messages for the project to storage."""
+        timer = CoordinatorMessageBatcher._timers.pop(project_id, None)
+        if timer:
+            timer.cancel()
+
+        messages = CoordinatorMessageBatcher._pending.pop(project_id, None)
+        if not messages:
+            return
+
+        try:
+            ProjectStorage.append_coordinator_messages(project_id, messages)
+        except Exception:
+            logger.exception(f"Error storing Coordinator messages for project {project_id}")
+
+    @staticmethod
+    def flush_all() -> None:
+        """Cancels the pending flush timers and writes all queued messages to storage."""
+        for project_id in set(CoordinatorMessageBatcher._pending) | set(CoordinatorMessageBatcher._timers):
+            CoordinatorMessageBatcher.flush(project_id)
+
+
+# A queued log event: entry type, message, related entity ID, metadata and the time it was queued
+_LogEvent = Tuple[str, str, Optional[str], Optional[Dict[str, Any]], datetime]
+
+
+class ProjectLogWriter:
+    """
+    Writes project log entries in the background.
+
+    Each project has its own queue, worked through in order by a background task, so entries are
+    logged in the order they were queued and a slow user lookup for one project doesn't hold up the
+    others. Queued events are stamped immediately and the user lookup happens in the background;
+    complete entries go through the same queue so they keep their place. Entries that are ready in
+    the same event loop iteration are appended to a project's log with a single read and write.
+    """
+
+    _queues: ClassVar[Dict[str, Deque[Tuple[ConversationContext, Union[LogEntry, _LogEvent]]]]] = {}
+    _consumers: ClassVar[Dict[str, asyncio.Task]] = {}
+    _pending: ClassVar[Dict[str, List[LogEntry]]] = {}
+    _conversations: ClassVar[Dict[str, str]] = {}
+
+    @staticmethod
+    def enqueue(
+        context: ConversationContext,
+        project_id: str,
+        entry_type: str,
+        message: str,
+        related_entity_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Queues an event for the project log. Must be called from a running event loop.
+
+        Args:
+            context: Current conversation context
+            project_id: ID of the project
+            entry_type: Type of log entry
+            message: Log message
+            related_entity_id: Optional ID of a related entity (e.g., information request)
+            metadata: Optional additional metadata
+        """
+        ProjectLogWriter._put(
+            context,
+            project_id,
+            (entry_type, message, related_entity_id, metadata, datetime.utcnow()),
+        )
+
+    @staticmethod
+    def append(context: ConversationContext, project_id: str, entry: LogEntry) -> None:
+        """
+        Queues a complete log entry to be written. Must be called from a running event loop.
+
+        Args:
+            context: Current conversation context
+            project_id: ID of the project
+            entry: The entry to append
+        """
+        ProjectLogWriter._put(context, project_id, entry)
+
+    @staticmethod
+    def _put(
+        context: ConversationContext,
+        project_id: str,
+        item: Union[LogEntry, _LogEvent],
+    ) -> None:
+        """Adds an item to the project's queue, starting its consumer if it isn't running."""
+        ProjectLogWriter._queues.setdefault(project_id, deque()).append((context, item))
+        if project_id not in ProjectLogWriter._consumers:
+            ProjectLogWriter._consumers[project_id] = asyncio.create_task(ProjectLogWriter._consume(project_id))
+
+    @staticmethod
+    async def _consume(project_id: str) -> None:
+        """Builds log entries for the project's queued items, one at a time in the order they were queued."""
+        queue = ProjectLogWriter._queues[project_id]
+        try:
+            while queue:
+                context, item = queue.popleft()
+                entry = item if isinstance(item, LogEntry) else await ProjectLogWriter._build_entry(context, *item)
+                if entry:
+                    ProjectLogWriter._stage(project_id, entry, str(context.id))
+        finally:
+            ProjectLogWriter._queues.pop(project_id, None)
+            ProjectLogWriter._consumers.pop(project_id, None)
+
+    @staticmethod
+    async def _build_entry(
+        context: ConversationContext,
+        entry_type: str,
+        message: str,
+        related_entity_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        timestamp: datetime,
+    ) -> Optional[LogEntry]:
+        """Builds a log entry for the current user."""
+        try:
+            user_id, user_name = await get_current_user(context)
+            if not user_id:
+                return None
+
+            return LogEntry(
+                timestamp=timestamp,
+                entry_type=LogEntryType(entry_type),
+                message=message,
+                user_id=user_id,
+                user_name=user_name or "Unknown User",
+                related_entity_id=related_entity_id,
+                metadata=metadata or {},
+            )
+        except Exception:
+            logger.exception(f"Error creating log entry for conversation {context.id}")
+            return None
+
+    @staticmethod
+    def _stage(project_id: str, entry: LogEntry, conversation_id: str) -> None:
+        """Schedules a complete log entry to be written with any others ready for the project."""
+        pending = ProjectLogWriter._pending.setdefault(project_id, [])
+        pending.append(entry)
+        ProjectLogWriter._conversations.setdefault(project_id, conversation_id)
+        if len(pending) == 1:
+            asyncio.get_running_loop().call_soon(ProjectLogWriter._write, project_id)
+
+    @staticmethod
+    def _write(project_id: str) -> None:
+        """Appends the pending entries for a project to its log."""
+        entries = ProjectLogWriter._pending.pop(project_id, None)
+        conversation_id = ProjectLogWriter._conversations.pop(project_id, "")
+        if not entries:
+            return
+
+        try:
+            ProjectStorage.append_log_entries(project_id, entries, conversation_id)
+        except Exception:
+            logger.exception(f"Error writing log entries for project {project_id}")
+
+    @staticmethod
+    async def flush() -> None:
+        """Waits for all queued log entries to be written."""
+        while ProjectLogWriter._consumers:
+            await asyncio.wait(list(ProjectLogWriter._consumers.values()))
+        for project_id in list(ProjectLogWriter._pending):
+            ProjectLogWriter._write(project_id)
+
+
+class ProjectUIRefresher:
+    """
+    Coalesces refreshes of a project's UI inspector panels.
+
+    A refresh is sent REFRESH_DELAY_SECONDS after the first request for a project, and covers any
+    further requests made in the meantime, so a burst of updates refreshes each panel once.
+    """
+
+    REFRESH_DELAY_SECONDS = 0.2
+
+    _timers: ClassVar[Dict[str, asyncio.TimerHandle]] = {}
+    _tasks: ClassVar[Set[asyncio.Task]] = set()
+
+    @staticmethod
+    def schedule(context: ConversationContext, project_id: str) -> None:
+        """
+        Schedules a refresh of all UI inspector panels in the project. Must be called from a running event loop.
+
+        Args:
+            context: Current conversation context
+            project_id: The project ID
+        """
+        if project_id in ProjectUIRefresher._timers:
+            return
+
+        ProjectUIRefresher._timers[project_id] = asyncio.get_running_loop().call_later(
+            ProjectUIRefresher.REFRESH_DELAY_SECONDS, ProjectUIRefresher._refresh, context, project_id
+        )
+
+    @staticmethod
+    def _refresh(context: ConversationContext, project_id: str) -> None:
+        """Starts the scheduled refresh for a project."""
+        ProjectUIRefresher._timers.pop(project_id, None)
+        task = asyncio.create_task(ProjectStorage.refresh_all_project_uis(context, project_id))
+        ProjectUIRefresher._tasks.add(task)
+        task.add_done_callback(ProjectUIRefresher._tasks.discard)
 
 
 class ProjectNotifier:
     """Handles notifications between conversations for project updates."""
 
+    _tasks: ClassVar[Set[asyncio.Task]] = set()
+
     @staticmethod
     async def send_notice_to_linked_conversations(context: ConversationContext, project_id: str, message: str) -> None:
         """
@@ -545,7 +1105,7 @@ class ProjectNotifier:
         This method:
         1. Sends a notice message to the current conversation
         2. Sends the same notice message to all linked conversations
-        3. Refreshes UI inspector panels for all conversations in the project
+        3. Schedules a refresh of the UI inspector panels for all conversations in the project
 
         Use this for important project updates that need both user notification AND UI refresh.
 
@@ -568,8 +1128,39 @@ class ProjectNotifier:
         # Notify all linked conversations with the same message
         await ProjectNotifier.send_notice_to_linked_conversations(context, project_id, message)
 
-        # Refresh all project UI inspector panels
-        await ProjectStorage.refresh_all_project_uis(context, project_id)
+        # Refresh all project UI inspector panels, together with any other updates made at the same time
+        ProjectUIRefresher.schedule(context, project_id)
+
+    @staticmethod
+    def notify_project_update_in_background(
+        context: ConversationContext,
+        project_id: str,
+        update_type: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Sends a project update (see notify_project_update) in a background task, for updates the caller
+        doesn't need to wait for. Must be called from a running event loop; failures are logged.
+        """
+        task = asyncio.create_task(
+            ProjectNotifier._notify_project_update_logged(context, project_id, update_type, message, data)
+        )
+        ProjectNotifier._tasks.add(task)
+        task.add_done_callback(ProjectNotifier._tasks.discard)
+
+    @staticmethod
+    async def _notify_project_update_logged(
+        context: ConversationContext,
+        project_id: str,
+        update_type: str,
+        message: str,
+        data: Optional[Dict[str, Any]],
+    ) -> None:
+        try:
+            await ProjectNotifier.notify_project_update(context, project_id, update_type, message, data)
+        except Exception:
+            logger.exception(f"Error sending {update_type} update for project {project_id}")
 
 
 class ConversationProjectManager:
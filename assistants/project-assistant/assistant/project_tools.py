@@ -39,10 +39,12 @@ from .project_data import (
 from .project_manager import ProjectManager
 from .project_storage import (
     ConversationProjectManager,
+    CoordinatorMessageBatcher,
     ProjectNotifier,
     ProjectRole,
     ProjectStorage,
     ProjectStorageManager,
+    ProjectUIRefresher,
 )
 from .utils import load_text_include
 
@@ -558,6 +560,7 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
             progress=progress,
             status_message=status_message,
             next_actions=next_actions,
+            project_id=project_id,
         )
 
         if success and dashboard:
@@ -691,9 +694,6 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
                 message=f"Success criterion '{criterion.description}' for goal '{goal.name}' has been marked as completed.",
             )
 
-            # Update all project UI inspectors
-            await ProjectStorage.refresh_all_project_uis(self.context, project_id)
-
             # Check if all criteria are completed for project completion
             if completed_criteria == total_criteria and total_criteria > 0:
                 await self.context.send_messages(
@@ -780,12 +780,7 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
                 goals=brief.goals,
             )
 
-            # Calculate total criteria
-            total_criteria = 0
-            for goal in brief.goals:
-                total_criteria += len(goal.success_criteria)
-
-            dashboard.total_criteria = total_criteria
+            dashboard.total_criteria = sum(len(goal.success_criteria) for goal in brief.goals)
 
         # Update dashboard to ready_for_working
         dashboard.state = ProjectState.READY_FOR_WORKING
@@ -824,9 +819,6 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
             message="🔔 **Project Milestone Reached**: Coordinator has marked the project as READY FOR WORKING. All project information is now available and you can begin team operations.",
         )
 
-        # Update all project UI inspectors
-        await ProjectStorage.refresh_all_project_uis(self.context, project_id)
-
         await self.context.send_messages(
             NewConversationMessage(
                 content="🎯 Project has been marked as READY FOR WORKING. Team members have been notified and can now begin operations.",
@@ -916,9 +908,6 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
             message="🎉 **Project Complete**: Team has reported that all project objectives have been achieved. The project is now complete.",
         )
 
-        # Update all project UI inspectors
-        await ProjectStorage.refresh_all_project_uis(self.context, project_id)
-
         await self.context.send_messages(
             NewConversationMessage(
                 content="🎉 **Project Complete**: All objectives have been achieved and the project is now complete. The Coordinator has been notified.",
@@ -958,7 +947,8 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
         try:
             # Read from shared storage instead of trying cross-conversation API access
 
-            # Read Coordinator conversation messages from shared storage
+            # Read Coordinator conversation messages from shared storage, including any still queued
+            CoordinatorMessageBatcher.flush(project_id)
             coordinator_conversation = ProjectStorage.read_coordinator_conversation(project_id)
 
             if not coordinator_conversation or not coordinator_conversation.messages:
@@ -1139,13 +1129,7 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
             )
 
             # Update project dashboard if this was a blocker
-            dashboard = ProjectStorage.read_project_dashboard(project_id)
-            if dashboard and hasattr(dashboard, "active_requests") and actual_request_id in dashboard.active_requests:
-                dashboard.active_requests.remove(actual_request_id)
-                dashboard.updated_at = datetime.utcnow()
-                dashboard.updated_by = current_user_id
-                dashboard.version += 1
-                ProjectStorage.write_project_dashboard(project_id, dashboard)
+            ProjectStorage.update_dashboard_active_requests(project_id, current_user_id, remove=[actual_request_id])
 
             # Delete the information request - implementing deletion logic by removing the file
             # Using ProjectStorage instead of direct path access
@@ -1183,7 +1167,7 @@ Example: resolve_information_request(request_id="abc123-def-456", resolution="Yo
                 # Not critical, so we continue
 
             # Update all project UI inspectors
-            await ProjectStorage.refresh_all_project_uis(self.context, project_id)
+            ProjectUIRefresher.schedule(self.context, project_id)
 
             return f"Information request '{request_title}' has been successfully deleted."
 
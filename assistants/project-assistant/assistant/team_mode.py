@@ -20,7 +20,7 @@ from .project_data import (
     RequestPriority,
     RequestStatus,
 )
-from .project_manager import ProjectManager
+from .project_manager import BLOCKING_PRIORITIES, ProjectManager
 from .project_storage import (
     ConversationProjectManager,
     ProjectRole,
@@ -183,14 +183,8 @@ class TeamConversationHandler:
         )
 
         # Update project dashboard to include this request as a potential blocker
-        dashboard = await ProjectManager.get_project_dashboard(self.context)
-        if dashboard and priority in [RequestPriority.HIGH, RequestPriority.CRITICAL] and request.request_id:
-            dashboard.active_requests.append(request.request_id)
-            dashboard.updated_at = datetime.utcnow()
-            dashboard.updated_by = user_id
-            dashboard.version += 1
-
-            ProjectStorage.write_project_dashboard(project_id, dashboard)
+        if priority in BLOCKING_PRIORITIES and request.request_id:
+            ProjectStorage.update_dashboard_active_requests(project_id, user_id, add=[request.request_id])
 
         # Send notification
         await self.context.send_messages(
@@ -5,6 +5,7 @@ This module provides common utility functions used across the project assistant
 codebase, helping to reduce code duplication and maintain consistency.
 """
 
+import functools
 import logging
 import pathlib
 from typing import Optional, Tuple
@@ -14,10 +15,13 @@ from semantic_workbench_assistant.assistant_app import ConversationContext
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def load_text_include(filename) -> str:
     """
     Helper for loading an include from a text file.
 
+    The text includes ship with the assistant, so each file is only read from disk once.
+
     Args:
         filename: The name of the text file to load from the text_includes directory
 
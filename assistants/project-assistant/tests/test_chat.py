@@ -0,0 +1,236 @@
+"""
+Tests for the response cache, conversation caches and background file event handling in the chat module.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from assistant import chat
+from assistant.project_storage import ProjectRole
+from openai.types.chat import (
+    ChatCompletionAssistantMessageParam,
+    ChatCompletionMessageToolCallParam,
+    ChatCompletionToolMessageParam,
+)
+
+# The event decorators register the handlers; pyright types the decorated names as returning None
+on_file_updated = cast(Callable[..., Awaitable[None]], chat.on_file_updated)
+on_file_deleted = cast(Callable[..., Awaitable[None]], chat.on_file_deleted)
+
+
+@pytest.fixture(autouse=True)
+def clear_chat_state():
+    """Start each test with empty module-level caches and queues."""
+    caches = [
+        chat._response_cache,
+        chat._project_id_cache,
+        chat._role_cache,
+        chat._role_detect_cache,
+        chat._brief_owner_cache,
+        chat._participants_cache,
+        chat._pending_file_updates,
+        chat._pending_file_args,
+        chat._file_event_tasks,
+    ]
+    for cache in caches:
+        cache.clear()
+    yield
+    for timer in chat._pending_file_updates.values():
+        timer.cancel()
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture
+def context():
+    context = MagicMock()
+    context.id = "test-conversation-id"
+    return context
+
+
+def make_file(filename: str) -> MagicMock:
+    file = MagicMock()
+    file.filename = filename
+    return file
+
+
+async def drain_file_events() -> None:
+    """Wait for all background file event tasks to finish."""
+    while chat._file_event_tasks:
+        await asyncio.gather(*list(chat._file_event_tasks.values()), return_exceptions=True)
+
+
+class TestResponseCache:
+    """Test the completion response cache."""
+
+    def completion_args(self, content: str) -> dict:
+        return {
+            "messages": [{"role": "user", "content": content}],
+            "model": "gpt-4o",
+            "max_tokens": 100,
+        }
+
+    def test_cache_miss_and_hit(self):
+        key = chat.get_response_cache_key(self.completion_args("Hello"))
+        assert chat.get_cached_response(key) is None
+
+        chat.cache_response(key, "Hi there")
+
+        # An identical request produces the same key and hits the cache
+        assert chat.get_response_cache_key(self.completion_args("Hello")) == key
+        assert chat.get_cached_response(key) == "Hi there"
+
+        # A different request misses
+        other_key = chat.get_response_cache_key(self.completion_args("Goodbye"))
+        assert other_key != key
+        assert chat.get_cached_response(other_key) is None
+
+    def test_least_recently_used_eviction(self, monkeypatch):
+        monkeypatch.setattr(chat, "RESPONSE_CACHE_SIZE", 2)
+        keys = [chat.get_response_cache_key(self.completion_args(str(i))) for i in range(3)]
+
+        chat.cache_response(keys[0], "0")
+        chat.cache_response(keys[1], "1")
+        chat.get_cached_response(keys[0])  # Mark the first entry as recently used
+        chat.cache_response(keys[2], "2")
+
+        assert chat.get_cached_response(keys[0]) == "0"
+        assert chat.get_cached_response(keys[1]) is None
+        assert chat.get_cached_response(keys[2]) == "2"
+
+    def test_only_plain_answers_are_cacheable(self):
+        plain_answer = ChatCompletionAssistantMessageParam(role="assistant", content="Plain answer")
+        assert chat.is_cacheable_response([plain_answer])
+
+        # Responses that called tools are never cached
+        tool_call = ChatCompletionMessageToolCallParam(
+            id="call-1", type="function", function={"name": "get_project_info", "arguments": "{}"}
+        )
+        tool_call_message = ChatCompletionAssistantMessageParam(role="assistant", content=None, tool_calls=[tool_call])
+        tool_result = ChatCompletionToolMessageParam(role="tool", tool_call_id="call-1", content="{}")
+        answer_after_tools = ChatCompletionAssistantMessageParam(role="assistant", content="Answer after tools")
+        assert not chat.is_cacheable_response([tool_call_message])
+        assert not chat.is_cacheable_response([tool_call_message, tool_result, answer_after_tools])
+        assert not chat.is_cacheable_response([])
+
+
+class TestProjectCache:
+    """Test the per-conversation project ID and role cache."""
+
+    async def test_project_id_is_cached_after_a_hit(self, context, monkeypatch):
+        get_project_id = AsyncMock(return_value="project-1")
+        monkeypatch.setattr(chat.ProjectManager, "get_project_id", get_project_id)
+
+        assert await chat.get_cached_project_id(context) == "project-1"
+        assert await chat.get_cached_project_id(context) == "project-1"
+        get_project_id.assert_awaited_once()
+
+    async def test_missing_project_id_is_not_cached(self, context, monkeypatch):
+        get_project_id = AsyncMock(return_value=None)
+        monkeypatch.setattr(chat.ProjectManager, "get_project_id", get_project_id)
+
+        assert await chat.get_cached_project_id(context) is None
+        assert await chat.get_cached_project_id(context) is None
+        assert get_project_id.await_count == 2
+
+    async def test_invalidate_project_cache(self, context, monkeypatch):
+        get_project_id = AsyncMock(return_value="project-1")
+        get_role = AsyncMock(return_value=ProjectRole.COORDINATOR)
+        monkeypatch.setattr(chat.ProjectManager, "get_project_id", get_project_id)
+        monkeypatch.setattr(chat.ConversationProjectManager, "get_conversation_role", get_role)
+
+        await chat.get_cached_project_id(context)
+        await chat.get_cached_role(context)
+        chat._role_detect_cache[context.id] = "coordinator"
+        chat._project_id_cache["other-conversation-id"] = "project-2"
+
+        chat.invalidate_project_cache(context)
+
+        assert context.id not in chat._project_id_cache
+        assert context.id not in chat._role_cache
+        assert context.id not in chat._role_detect_cache
+        assert chat._project_id_cache["other-conversation-id"] == "project-2"
+
+        # The next lookups read storage again
+        await chat.get_cached_project_id(context)
+        await chat.get_cached_role(context)
+        assert get_project_id.await_count == 2
+        assert get_role.await_count == 2
+
+    async def test_project_id_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(chat, "CONVERSATION_CACHE_SIZE", 2)
+        monkeypatch.setattr(chat.ProjectManager, "get_project_id", AsyncMock(return_value="project-1"))
+
+        contexts = [MagicMock(id=f"conversation-{i}") for i in range(3)]
+        await chat.get_cached_project_id(contexts[0])
+        await chat.get_cached_project_id(contexts[1])
+        await chat.get_cached_project_id(contexts[0])  # Mark the first conversation as recently used
+        await chat.get_cached_project_id(contexts[2])
+
+        # The least recently used conversation is evicted
+        assert list(chat._project_id_cache) == ["conversation-0", "conversation-2"]
+
+
+class TestFileEvents:
+    """Test the debouncing and ordering of background file event processing."""
+
+    @pytest.fixture(autouse=True)
+    def project(self, monkeypatch):
+        monkeypatch.setattr(chat, "FILE_UPDATE_DEBOUNCE_SECONDS", 0.01)
+        monkeypatch.setattr(chat, "get_cached_project_id", AsyncMock(return_value="project-1"))
+        monkeypatch.setattr(chat, "get_cached_role", AsyncMock(return_value=ProjectRole.COORDINATOR))
+
+    async def test_update_debounce_coalescing(self, context, monkeypatch):
+        process_file_updated = AsyncMock()
+        monkeypatch.setattr(chat, "_process_file_updated", process_file_updated)
+
+        files = [make_file("notes.md") for _ in range(3)]
+        for file in files:
+            await on_file_updated(context, MagicMock(), file)
+
+        await asyncio.sleep(0.05)
+        await drain_file_events()
+
+        # Only the latest of the burst of updates is processed
+        process_file_updated.assert_awaited_once_with(context, "project-1", files[-1])
+
+    async def test_delete_cancels_pending_update(self, context, monkeypatch):
+        process_file_updated = AsyncMock()
+        process_file_deleted = AsyncMock()
+        monkeypatch.setattr(chat, "_process_file_updated", process_file_updated)
+        monkeypatch.setattr(chat, "_process_file_deleted", process_file_deleted)
+
+        file = make_file("notes.md")
+        await on_file_updated(context, MagicMock(), file)
+        await on_file_deleted(context, MagicMock(), file)
+
+        await asyncio.sleep(0.05)
+        await drain_file_events()
+
+        process_file_updated.assert_not_awaited()
+        process_file_deleted.assert_awaited_once_with(context, "project-1", file, ProjectRole.COORDINATOR)
+        assert not chat._pending_file_updates
+
+    async def test_events_for_a_file_run_in_order(self):
+        order = []
+        copy_started = asyncio.Event()
+
+        async def slow_copy():
+            copy_started.set()
+            await asyncio.sleep(0.02)
+            order.append("copy")
+
+        async def delete():
+            order.append("delete")
+
+        chat.start_file_event_task("project-1", "notes.md", slow_copy())
+        await copy_started.wait()
+        chat.start_file_event_task("project-1", "notes.md", delete())
+
+        await drain_file_events()
+
+        # The deletion waits for the copy that was already running
+        assert order == ["copy", "delete"]
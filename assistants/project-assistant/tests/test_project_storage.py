@@ -2,18 +2,23 @@
 Tests for the direct project storage functionality.
 """
 
+import asyncio
 import pathlib
 import shutil
 import unittest
 import unittest.mock
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from typing import cast
 
+from assistant import chat
 from assistant.project_data import (
     InformationRequest,
     LogEntry,
     LogEntryType,
     ProjectBrief,
+    ProjectDashboard,
     ProjectGoal,
     ProjectLog,
     RequestPriority,
@@ -21,13 +26,19 @@ from assistant.project_data import (
     SuccessCriterion,
 )
 from assistant.project_storage import (
+    CoordinatorMessageBatcher,
+    ProjectLogWriter,
     ProjectRole,
     ProjectStorage,
     ProjectStorageManager,
+    ProjectUIRefresher,
 )
 from semantic_workbench_assistant import settings
 from semantic_workbench_assistant.storage import write_model
 
+# The event decorator registers the handler; pyright types the decorated name as returning None
+on_service_shutdown = cast(Callable[[], Awaitable[None]], chat.on_service_shutdown)
+
 
 class TestProjectStorage(unittest.IsolatedAsyncioTestCase):
     """Test the direct project storage functionality."""
@@ -170,6 +181,72 @@ class TestProjectStorage(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(request.description, "This is a test request")
             self.assertEqual(request.priority, RequestPriority.HIGH)
 
+    async def test_query_information_requests(self):
+        """Test filtering information requests by status and conversation."""
+        resolved_request = InformationRequest(
+            request_id=str(uuid.uuid4()),
+            title="Resolved Request",
+            description="This request has been resolved",
+            status=RequestStatus.RESOLVED,
+            created_by=self.user_id,
+            updated_by=self.user_id,
+            conversation_id=self.conversation_id,
+        )
+        ProjectStorage.write_information_request(self.project_id, resolved_request)
+
+        active = ProjectStorage.query_information_requests(self.project_id, exclude_statuses={RequestStatus.RESOLVED})
+        self.assertEqual([r.title for r in active], ["Test Request"])
+
+        others = ProjectStorage.query_information_requests(
+            self.project_id, exclude_conversation_id=self.conversation_id
+        )
+        self.assertEqual(others, [])
+
+        limited = ProjectStorage.query_information_requests(
+            self.project_id, conversation_id=self.conversation_id, limit=1
+        )
+        self.assertEqual(len(limited), 1)
+
+    async def test_read_project_brief_cache(self):
+        """Test that cached brief reads return independent copies and see new writes."""
+        brief = ProjectStorage.read_project_brief(self.project_id)
+        self.assertIsNotNone(brief)
+        if brief:  # Type checking guard
+            brief.project_name = "Modified Without Saving"
+
+        cached_brief = ProjectStorage.read_project_brief(self.project_id)
+        self.assertIsNotNone(cached_brief)
+        if cached_brief:  # Type checking guard
+            self.assertEqual(cached_brief.project_name, "Test Project")
+
+            cached_brief.project_name = "Saved Project Name"
+            ProjectStorage.write_project_brief(self.project_id, cached_brief)
+
+        updated_brief = ProjectStorage.read_project_brief(self.project_id)
+        self.assertIsNotNone(updated_brief)
+        if updated_brief:  # Type checking guard
+            self.assertEqual(updated_brief.project_name, "Saved Project Name")
+
+    async def test_update_dashboard_active_requests(self):
+        """Test adding and removing active requests on the dashboard."""
+        dashboard = ProjectDashboard(
+            created_by=self.user_id,
+            updated_by=self.user_id,
+            conversation_id=self.conversation_id,
+        )
+        ProjectStorage.write_project_dashboard(self.project_id, dashboard)
+
+        self.assertTrue(ProjectStorage.update_dashboard_active_requests(self.project_id, self.user_id, add=["a", "b"]))
+        self.assertFalse(ProjectStorage.update_dashboard_active_requests(self.project_id, self.user_id, add=["a"]))
+        self.assertTrue(ProjectStorage.update_dashboard_active_requests(self.project_id, self.user_id, remove=["a"]))
+        self.assertFalse(ProjectStorage.update_dashboard_active_requests(self.project_id, self.user_id, remove=["a"]))
+
+        updated_dashboard = ProjectStorage.read_project_dashboard(self.project_id)
+        self.assertIsNotNone(updated_dashboard)
+        if updated_dashboard:  # Type checking guard
+            self.assertEqual(updated_dashboard.active_requests, ["b"])
+            self.assertEqual(updated_dashboard.version, dashboard.version + 2)
+
     async def test_write_project_log(self):
         """Test writing a project log."""
         # Create a log entry and proper LogEntry objects
@@ -202,6 +279,165 @@ class TestProjectStorage(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(log.entries[0].entry_type, LogEntryType.INFORMATION_UPDATE)
             self.assertEqual(log.entries[0].message, "Test log entry")
 
+    async def test_append_log_entries(self):
+        """Test that appended log entries go to the entries file and are read back with the log."""
+        for i in range(2):
+            ProjectStorage.append_log_entries(
+                self.project_id,
+                [
+                    LogEntry(
+                        entry_type=LogEntryType.INFORMATION_UPDATE,
+                        message=f"Entry {i}",
+                        user_id=self.user_id,
+                        user_name="Test User",
+                    )
+                ],
+                self.conversation_id,
+            )
+
+        # Only the entries file grows; the log file keeps the metadata
+        entries_path = ProjectStorageManager.get_project_log_entries_path(self.project_id)
+        self.assertEqual(len(entries_path.read_text().splitlines()), 2)
+
+        log = ProjectStorage.read_project_log(self.project_id)
+        self.assertIsNotNone(log, "Should load the log")
+        if log:  # Type checking guard
+            self.assertEqual([entry.message for entry in log.entries], ["Entry 0", "Entry 1"])
+            self.assertEqual(log.version, 3)
+
+    async def test_coordinator_message_batching(self):
+        """Test that queued Coordinator messages are written together on flush."""
+        for i in range(3):
+            CoordinatorMessageBatcher.enqueue(
+                project_id=self.project_id,
+                message_id=f"message-{i}",
+                content=f"Message {i}",
+                sender_name="Coordinator",
+            )
+
+        # Nothing is written until the batch is flushed
+        self.assertIsNone(ProjectStorage.read_coordinator_conversation(self.project_id))
+
+        CoordinatorMessageBatcher.flush(self.project_id)
+
+        conversation = ProjectStorage.read_coordinator_conversation(self.project_id)
+        self.assertIsNotNone(conversation, "Should load the Coordinator conversation")
+        if conversation:  # Type checking guard
+            self.assertEqual([m.message_id for m in conversation.messages], ["message-0", "message-1", "message-2"])
+
+    async def test_shutdown_flushes_coordinator_messages(self):
+        """Test that Coordinator messages still queued at shutdown are written to storage."""
+        for i in range(3):
+            CoordinatorMessageBatcher.enqueue(
+                project_id=self.project_id,
+                message_id=f"message-{i}",
+                content=f"Message {i}",
+                sender_name="Coordinator",
+            )
+
+        with unittest.mock.patch("assistant.chat.close_whiteboard_clients", new_callable=unittest.mock.AsyncMock):
+            await on_service_shutdown()
+
+        self.assertFalse(CoordinatorMessageBatcher._timers, "Should cancel the pending flush timers")
+        conversation = ProjectStorage.read_coordinator_conversation(self.project_id)
+        self.assertIsNotNone(conversation, "Should write the queued messages")
+        if conversation:  # Type checking guard
+            self.assertEqual([m.message_id for m in conversation.messages], ["message-0", "message-1", "message-2"])
+
+    async def test_shutdown_flushes_log_entries(self):
+        """Test that log entries still queued at shutdown are written to the project log."""
+        with (
+            unittest.mock.patch("assistant.project_storage.get_current_user", return_value=(self.user_id, "Test User")),
+            unittest.mock.patch("assistant.chat.close_whiteboard_clients", new_callable=unittest.mock.AsyncMock),
+        ):
+            ProjectLogWriter.enqueue(
+                context=self.context,
+                project_id=self.project_id,
+                entry_type=LogEntryType.INFORMATION_UPDATE.value,
+                message="Entry",
+            )
+            await on_service_shutdown()
+
+        log = ProjectStorage.read_project_log(self.project_id)
+        self.assertIsNotNone(log, "Should write the queued log entry")
+        if log:  # Type checking guard
+            self.assertEqual([entry.message for entry in log.entries], ["Entry"])
+
+    async def test_ui_refresh_coalescing(self):
+        """Test that refreshes scheduled together for a project are sent once."""
+        with unittest.mock.patch(
+            "assistant.project_storage.ProjectStorage.refresh_all_project_uis", new_callable=unittest.mock.AsyncMock
+        ) as mock_refresh:
+            for _ in range(3):
+                ProjectUIRefresher.schedule(self.context, self.project_id)
+
+            await asyncio.sleep(ProjectUIRefresher.REFRESH_DELAY_SECONDS + 0.1)
+
+            mock_refresh.assert_awaited_once_with(self.context, self.project_id)
+
+    async def test_background_log_writes(self):
+        """Test that queued log events and entries are written to the project log in order."""
+        with unittest.mock.patch(
+            "assistant.project_storage.get_current_user", return_value=(self.user_id, "Test User")
+        ):
+            for i in range(3):
+                ProjectLogWriter.enqueue(
+                    context=self.context,
+                    project_id=self.project_id,
+                    entry_type=LogEntryType.INFORMATION_UPDATE.value,
+                    message=f"Entry {i}",
+                )
+            ProjectLogWriter.append(
+                self.context,
+                self.project_id,
+                LogEntry(
+                    entry_type=LogEntryType.INFORMATION_UPDATE,
+                    message="Entry 3",
+                    user_id=self.user_id,
+                    user_name="Test User",
+                ),
+            )
+
+            await ProjectLogWriter.flush()
+
+        log = ProjectStorage.read_project_log(self.project_id)
+        self.assertIsNotNone(log, "Should load the project log")
+        if log:  # Type checking guard
+            self.assertEqual([entry.message for entry in log.entries], ["Entry 0", "Entry 1", "Entry 2", "Entry 3"])
+            self.assertEqual(log.entries[0].user_name, "Test User")
+
+    async def test_slow_log_user_lookup_does_not_block_other_projects(self):
+        """Test that a slow user lookup for one project doesn't hold up another project's log."""
+        other_project_id = str(uuid.uuid4())
+        lookup_released = asyncio.Event()
+
+        async def mock_get_current_user(context):
+            if context is not self.context:
+                await lookup_released.wait()
+            return self.user_id, "Test User"
+
+        other_context = unittest.mock.MagicMock()
+        other_context.id = str(uuid.uuid4())
+
+        with unittest.mock.patch("assistant.project_storage.get_current_user", side_effect=mock_get_current_user):
+            for context, project_id in [(other_context, other_project_id), (self.context, self.project_id)]:
+                ProjectLogWriter.enqueue(
+                    context=context,
+                    project_id=project_id,
+                    entry_type=LogEntryType.INFORMATION_UPDATE.value,
+                    message="Entry",
+                )
+
+            await asyncio.sleep(0.05)
+            self.assertIsNotNone(
+                ProjectStorage.read_project_log(self.project_id), "Should write the log while the other lookup waits"
+            )
+
+            lookup_released.set()
+            await ProjectLogWriter.flush()
+
+        self.assertIsNotNone(ProjectStorage.read_project_log(other_project_id))
+
     async def test_project_directory_structure(self):
         """Test the project directory structure."""
         # Verify project directory exists